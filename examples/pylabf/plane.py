@@ -36,14 +36,14 @@ from pylabf.vector import Vector, is_parallel
 # Initialize a some vectors                                              #
 # ---------------------------------------------------------------------- #
 
-planeA1 = Plane([Decimal(4.046), Decimal(2.836)], 1.21)
-planeA2 = Plane([Decimal(10.115), Decimal(7.09)], 3.025)
+planeA1 = Plane([Decimal(4.046), Decimal(2.836), Decimal(0)], 1.21)
+planeA2 = Plane([Decimal(10.115), Decimal(7.09), Decimal(0)], 3.025)
 
-planeB1 = Plane([Decimal(7.204), Decimal(3.182)], 8.68)
-planeB2 = Plane([Decimal(8.172), Decimal(4.114)], 9.883)
+planeB1 = Plane([Decimal(7.204), Decimal(3.182), Decimal(0)], 8.68)
+planeB2 = Plane([Decimal(8.172), Decimal(4.114), Decimal(0)], 9.883)
 
-planeC1 = Plane([Decimal(1.182), Decimal(5.562)], 6.744)
-planeC2 = Plane([Decimal(1.773), Decimal(8.343)], 9.525)
+planeC1 = Plane([Decimal(1.182), Decimal(5.562), Decimal(0)], 6.744)
+planeC2 = Plane([Decimal(1.773), Decimal(8.343), Decimal(0)], 9.525)
 
 print("A Plane")
 same_plane = planeA1.__eq__(planeA2)
@@ -23,6 +23,10 @@ __version__ = "0.0.1beta"
 # IMPORTS
 # =============================================================================
 
+from .backend import *  # noqa
+
+from .hyperplane import *  # noqa
+
 from .plane import *  # noqa
 
 from .linsys import *  # noqa
@@ -30,3 +34,25 @@ from .linsys import *  # noqa
 from .line import *  # noqa
 
 from .vector import *  # noqa
+
+from .vecarray import *  # noqa
+
+from .projection import *  # noqa
+
+from .tracing import *  # noqa
+
+from .lu import *  # noqa
+
+from .batchsolve import *  # noqa
+
+from .bareiss import *  # noqa
+
+from .incremental import *  # noqa
+
+from .iterative import *  # noqa
+
+from .sparse import *  # noqa
+
+from .parallel import *  # noqa
+
+from .lstsq import *  # noqa
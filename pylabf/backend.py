@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Numeric backends used to store and operate the coordinates.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import abc
+import contextlib
+import contextvars
+import math
+from decimal import Context, Decimal, localcontext
+from fractions import Fraction
+
+__all__ = [
+    "UNKNOWN_BACKEND_MSG",
+    "DEFAULT_DECIMAL_PRECISION",
+    "DEFAULT_TOLERANCE",
+    "Backend",
+    "FloatBackend",
+    "DecimalBackend",
+    "FractionBackend",
+    "FLOAT",
+    "DECIMAL",
+    "FRACTION",
+    "BACKENDS",
+    "get_backend",
+    "use_backend",
+    "is_near_zero",
+]
+
+UNKNOWN_BACKEND_MSG = "Unknown numeric backend: {}"
+
+DEFAULT_DECIMAL_PRECISION = 30
+DEFAULT_TOLERANCE = 1e-10
+
+
+class Backend(abc.ABC):
+    """Base class of the numeric backends.
+
+    A backend knows how to convert a value into its number type, how to
+    compute a square root and which arithmetic context the heavy
+    computations must run in.
+    """
+
+    name = None
+    # True when the arithmetic never rounds
+    exact = False
+
+    @abc.abstractmethod
+    def convert(self, value):
+        """``value`` as a number of this backend."""
+
+    @abc.abstractmethod
+    def sqrt(self, value):
+        """Square root of ``value`` as a number of this backend."""
+
+    def local_context(self):
+        return contextlib.nullcontext()
+
+    def __repr__(self):
+        return "<{} backend>".format(self.name)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        if BACKENDS.get(self.name) is self:
+            return (get_backend, (self.name,))
+        return super().__reduce__()
+
+
+class FloatBackend(Backend):
+    """Native float64 arithmetic."""
+
+    name = "float"
+
+    def convert(self, value):
+        return float(value)
+
+    def sqrt(self, value):
+        return math.sqrt(value)
+
+
+class DecimalBackend(Backend):
+    """Software ``Decimal`` arithmetic with a fixed precision."""
+
+    name = "decimal"
+
+    def __init__(self, precision=DEFAULT_DECIMAL_PRECISION):
+        self.precision = precision
+        self.context = Context(prec=precision)
+
+    def convert(self, value):
+        if isinstance(value, Fraction):
+            return self.context.divide(
+                Decimal(value.numerator), Decimal(value.denominator)
+            )
+        return Decimal(value)
+
+    def sqrt(self, value):
+        return Decimal(value).sqrt(self.context)
+
+    def local_context(self):
+        return localcontext(self.context)
+
+
+class FractionBackend(Backend):
+    """Exact rational arithmetic with ``fractions.Fraction``."""
+
+    name = "fraction"
+    exact = True
+
+    def __init__(self, precision=DEFAULT_DECIMAL_PRECISION):
+        # only used by the square roots
+        self.precision = precision
+        self.context = Context(prec=precision)
+
+    def convert(self, value):
+        if isinstance(value, Fraction):
+            return value
+        return Fraction(value)
+
+    def sqrt(self, value):
+        value = self.convert(value)
+        root = self.context.divide(
+            Decimal(value.numerator), Decimal(value.denominator)
+        ).sqrt(self.context)
+        return Fraction(root)
+
+
+FLOAT = FloatBackend()
+DECIMAL = DecimalBackend()
+FRACTION = FractionBackend()
+
+BACKENDS = {b.name: b for b in (FLOAT, DECIMAL, FRACTION)}
+
+_current_backend = contextvars.ContextVar("pylabf_backend", default=DECIMAL)
+
+
+def get_backend(backend=None) -> Backend:
+    """Resolve ``backend`` to a ``Backend`` instance.
+
+    ``None`` means the backend selected with ``use_backend`` (``Decimal``
+    by default). A string is looked up by name.
+    """
+    if backend is None:
+        return _current_backend.get()
+    if isinstance(backend, Backend):
+        return backend
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        raise ValueError(UNKNOWN_BACKEND_MSG.format(backend))
+
+
+@contextlib.contextmanager
+def use_backend(backend):
+    """Select the default backend inside a ``with`` block."""
+    backend = get_backend(backend)
+    token = _current_backend.set(backend)
+    try:
+        with backend.local_context():
+            yield backend
+    finally:
+        _current_backend.reset(token)
+
+
+def is_near_zero(value, eps=None) -> bool:
+    """Check if ``value`` is smaller than ``eps`` in absolute value."""
+    _eps = DEFAULT_TOLERANCE if eps is None else eps
+    return abs(value) < _eps
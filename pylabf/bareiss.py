@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Exact fraction-free (Bareiss) elimination of a LinearSystem.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import math
+from fractions import Fraction
+
+from .backend import FRACTION
+from .linsys import LinearSystem, Parametrization
+from .vector import Vector
+
+__all__ = ["BareissElimination"]
+
+
+class BareissElimination(object):
+    """Row echelon form of a system computed over the integers.
+
+    Every equation is converted to exact rationals and scaled by the
+    least common multiple of its denominators, so the elimination only
+    handles integers. Bareiss' exact divisions keep each entry bounded
+    by a minor of the input matrix instead of letting it grow
+    exponentially. Rank, determinant and solutions are exact.
+
+    Parameters
+    ----------
+    system : LinearSystem
+        Any system, whatever its backend. ``Decimal`` and float
+        coefficients are converted to the rational they represent.
+    """
+
+    DETERMINANT_ONLY_FOR_SQUARE_SYSTEMS_MSG = (
+        "The determinant is only defined for square systems"
+    )
+
+    def __init__(self, system):
+        self.dimension = system.dimension
+        self.num_equations = len(system)
+        self._row_scale = 1
+        self._sign = 1
+        matrix = [self._integer_row(row) for row in system._rows]
+        self.pivots = self._eliminate(matrix)
+        self.matrix = matrix
+
+    @property
+    def rank(self):
+        return len(self.pivots)
+
+    def _integer_row(self, row):
+        row = [Fraction(v) for v in row]
+        scale = 1
+        for v in row:
+            scale = scale * v.denominator // math.gcd(scale, v.denominator)
+        self._row_scale *= scale
+        return [int(v * scale) for v in row]
+
+    def _eliminate(self, matrix):
+        num_rows = len(matrix)
+        num_columns = self.dimension + 1
+        pivots = []
+        previous = 1
+        r = 0
+        for col in range(self.dimension):
+            if r == num_rows:
+                break
+            p = next((i for i in range(r, num_rows) if matrix[i][col]), None)
+            if p is None:
+                continue
+            if p != r:
+                matrix[r], matrix[p] = matrix[p], matrix[r]
+                self._sign = -self._sign
+            pivot_row = matrix[r]
+            pivot = pivot_row[col]
+            for i in range(r + 1, num_rows):
+                row = matrix[i]
+                factor = row[col]
+                for j in range(col + 1, num_columns):
+                    row[j] = (
+                        pivot * row[j] - factor * pivot_row[j]
+                    ) // previous
+                row[col] = 0
+            previous = pivot
+            pivots.append(col)
+            r += 1
+        return pivots
+
+    @property
+    def is_consistent(self):
+        return not any(row[-1] for row in self.matrix[self.rank :])
+
+    def determinant(self) -> Fraction:
+        """Exact determinant of the coefficient matrix."""
+        if self.num_equations != self.dimension:
+            raise Exception(self.DETERMINANT_ONLY_FOR_SQUARE_SYSTEMS_MSG)
+        if self.rank < self.dimension:
+            return Fraction(0)
+        last = self.matrix[self.dimension - 1][self.dimension - 1]
+        return Fraction(self._sign * last, self._row_scale)
+
+    def _back_substitute(self, constants, free_values):
+        x = [Fraction(0)] * self.dimension
+        for col, value in free_values.items():
+            x[col] = Fraction(value)
+        for i in reversed(range(self.rank)):
+            row = self.matrix[i]
+            col = self.pivots[i]
+            s = sum([row[j] * x[j] for j in range(col + 1, self.dimension)])
+            x[col] = (Fraction(constants[i]) - s) / row[col]
+        return x
+
+    def solve(self, parametrize=True):
+        """Exact solution, with the same contract as
+        ``LinearSystem.solve``.
+        """
+        if not self.is_consistent:
+            raise Exception(LinearSystem.NO_SOLUTIONS_MSG)
+        constants = [row[-1] for row in self.matrix]
+        free = [c for c in range(self.dimension) if c not in self.pivots]
+        basepoint = self._back_substitute(constants, {c: 0 for c in free})
+        if not free:
+            return Vector(basepoint, backend=FRACTION)
+        if not parametrize:
+            raise Exception(LinearSystem.INF_SOLUTIONS_MSG)
+        zeros = [0] * self.rank
+        direction_vectors = [
+            Vector(
+                self._back_substitute(zeros, {c: int(c == f) for c in free}),
+                backend=FRACTION,
+            )
+            for f in free
+        ]
+        return Parametrization(
+            Vector(basepoint, backend=FRACTION), direction_vectors
+        )
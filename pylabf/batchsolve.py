@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Vectorized solver for large batches of small square systems.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+from .backend import DEFAULT_TOLERANCE
+
+__all__ = [
+    "UNIQUE_SOLUTION",
+    "NO_SOLUTIONS",
+    "INF_SOLUTIONS",
+    "SYSTEMS_MUST_BE_SQUARE_MSG",
+    "stack_systems",
+    "solve_small_systems",
+]
+
+UNIQUE_SOLUTION = 0
+NO_SOLUTIONS = 1
+INF_SOLUTIONS = 2
+
+SYSTEMS_MUST_BE_SQUARE_MSG = (
+    "The coefficients must have shape (N, k, k) and the constants (N, k)"
+)
+
+
+def stack_systems(systems):
+    """Stack small systems into coefficient and constant arrays.
+
+    Parameters
+    ----------
+    systems : iterable
+        Each item is a ``LinearSystem`` or a sequence of equations
+        (``Line``, ``Plane``...), e.g. pairs of lines or triples of
+        planes.
+
+    Returns
+    -------
+    coefficients, constants : numpy.ndarray
+        Arrays of shape ``(N, k, k)`` and ``(N, k)``.
+    """
+    coefficients = []
+    constants = []
+    for system in systems:
+        coefficients.append([e.normal_vector.coordinates for e in system])
+        constants.append([e.constant_term for e in system])
+    return (
+        np.array(coefficients, dtype=np.float64),
+        np.array(constants, dtype=np.float64),
+    )
+
+
+def _cramer(a, b):
+    k = a.shape[-1]
+    if k == 1:
+        det = a[:, 0, 0]
+        numerators = b
+    elif k == 2:
+        det = a[:, 0, 0] * a[:, 1, 1] - a[:, 0, 1] * a[:, 1, 0]
+        numerators = np.stack(
+            [
+                a[:, 1, 1] * b[:, 0] - a[:, 0, 1] * b[:, 1],
+                a[:, 0, 0] * b[:, 1] - a[:, 1, 0] * b[:, 0],
+            ],
+            axis=1,
+        )
+    else:
+        r0, r1, r2 = a[:, 0], a[:, 1], a[:, 2]
+        c12, c20, c01 = np.cross(r1, r2), np.cross(r2, r0), np.cross(r0, r1)
+        det = np.einsum("ij,ij->i", r0, c12)
+        numerators = (
+            b[:, 0, np.newaxis] * c12
+            + b[:, 1, np.newaxis] * c20
+            + b[:, 2, np.newaxis] * c01
+        )
+    return det, numerators
+
+
+def _is_regular(det, bound, tolerance):
+    # Hadamard's inequality: |det| <= product of the row norms
+    det = np.abs(det)
+    return (det > 0) & (det >= tolerance * bound)
+
+
+def solve_small_systems(coefficients, constants, tolerance=None):
+    """Solve N small square systems at once.
+
+    Systems of 1, 2 or 3 unknowns are solved in closed form (Cramer's
+    rule), bigger ones with batched LAPACK calls.
+
+    Parameters
+    ----------
+    coefficients : array_like, shape (N, k, k)
+    constants : array_like, shape (N, k)
+    tolerance : float, optional
+        A system is singular when its determinant is below ``tolerance``
+        times the product of the norms of its rows (the largest value
+        it can take), so the test doesn't depend on the scale of the
+        coefficients. The rank test of the singular systems uses the
+        same tolerance on rows normalized to unit length.
+
+    Returns
+    -------
+    solutions : numpy.ndarray, shape (N, k)
+        The solutions, ``nan`` where the solution is not unique.
+    status : numpy.ndarray, shape (N,)
+        ``UNIQUE_SOLUTION``, ``NO_SOLUTIONS`` or ``INF_SOLUTIONS``.
+    """
+    _tolerance = DEFAULT_TOLERANCE if tolerance is None else tolerance
+    a = np.asarray(coefficients, dtype=np.float64)
+    b = np.asarray(constants, dtype=np.float64)
+    if a.ndim != 3 or a.shape[1] != a.shape[2] or b.shape != a.shape[:2]:
+        raise ValueError(SYSTEMS_MUST_BE_SQUARE_MSG)
+
+    solutions = np.full(b.shape, np.nan)
+    status = np.full(len(a), UNIQUE_SOLUTION, dtype=np.int8)
+    bound = np.prod(np.linalg.norm(a, axis=2), axis=1)
+
+    if a.shape[-1] <= 3:
+        det, numerators = _cramer(a, b)
+        unique = _is_regular(det, bound, _tolerance)
+        solutions[unique] = numerators[unique] / det[unique, np.newaxis]
+    else:
+        det = np.linalg.det(a)
+        unique = _is_regular(det, bound, _tolerance)
+        solutions[unique] = np.linalg.solve(
+            a[unique], b[unique, :, np.newaxis]
+        )[..., 0]
+
+    singular = np.flatnonzero(~unique)
+    if len(singular):
+        augmented = np.concatenate(
+            [a[singular], b[singular, :, np.newaxis]], axis=2
+        )
+        norms = np.linalg.norm(augmented, axis=2, keepdims=True)
+        augmented /= np.where(norms, norms, 1.0)
+        rank = np.linalg.matrix_rank(augmented[..., :-1], tol=_tolerance)
+        augmented_rank = np.linalg.matrix_rank(augmented, tol=_tolerance)
+        status[singular] = np.where(
+            augmented_rank > rank, NO_SOLUTIONS, INF_SOLUTIONS
+        )
+    return solutions, status
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file was part of Linear-Algebra-Basic-Functions and was modified.
+# Copyright (c) 2016, Luis Espinosa de los Monteros. All rights reserved.
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Hyperplanes ``n . x = k`` in any dimension.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from fractions import Fraction
+
+from .backend import DECIMAL, get_backend, is_near_zero
+from .vector import Vector, is_parallel, is_orthogonal, minus
+
+__all__ = ["Hyperplane"]
+
+
+def _display_number(value, num_decimal_places):
+    # fractions are printed as rounded decimals too, not as p/q
+    if isinstance(value, Fraction):
+        value = DECIMAL.convert(value)
+    value = round(value, num_decimal_places)
+    if value % 1 == 0:
+        value = int(value)
+    return value
+
+
+class Hyperplane(object):
+    """The set of points ``x`` such that ``normal_vector . x = constant``.
+
+    Parameters
+    ----------
+    normal_vector : Vector or sequence, optional
+        Coefficients of the equation. When omitted the hyperplane is the
+        zero equation of the given ``dimension``.
+    constant_term : number, optional
+    backend : Backend or str, optional
+    dimension : int, optional
+        Required when ``normal_vector`` is omitted, otherwise it must
+        match the length of ``normal_vector``.
+    """
+
+    NO_NONZERO_ELEMENTS_FOUND_MSG = "No nonzero elements found"
+    EITHER_DIM_OR_NORMAL_VECTOR_MUST_BE_PROVIDED_MSG = (
+        "Either the dimension or the normal vector must be provided"
+    )
+    NORMAL_VECTOR_DIMENSION_MSG = (
+        "The normal vector must live in the dimension of the hyperplane"
+    )
+
+    def __init__(
+        self,
+        normal_vector=None,
+        constant_term=None,
+        backend=None,
+        dimension=None,
+    ):
+        if backend is None and isinstance(normal_vector, Vector):
+            backend = normal_vector.backend
+        self.backend = get_backend(backend)
+
+        if not normal_vector:
+            if dimension is None:
+                raise Exception(
+                    self.EITHER_DIM_OR_NORMAL_VECTOR_MUST_BE_PROVIDED_MSG
+                )
+            normal_vector = ["0"] * dimension
+        if isinstance(normal_vector, Vector):
+            normal_vector = normal_vector.coordinates
+        self.normal_vector = Vector(normal_vector, backend=self.backend)
+        if dimension is not None and self.normal_vector.dimension != dimension:
+            raise Exception(self.NORMAL_VECTOR_DIMENSION_MSG)
+        self.dimension = self.normal_vector.dimension
+
+        if not constant_term:
+            constant_term = "0"
+        self.constant_term = self.backend.convert(constant_term)
+
+        self._basepoint = None
+        self._has_basepoint = False
+
+    @property
+    def basepoint(self):
+        """A point of the hyperplane, ``None`` for the zero equation.
+
+        It is computed on first access.
+        """
+        if not self._has_basepoint:
+            self.set_basepoint()
+        return self._basepoint
+
+    def set_basepoint(self):
+        try:
+            n = self.normal_vector.coordinates
+            c = self.constant_term
+            basepoint_coords = ["0"] * self.dimension
+
+            initial_index = Hyperplane.first_nonzero_index(n)
+            initial_coefficient = n[initial_index]
+
+            with self.backend.local_context():
+                basepoint_coords[initial_index] = c / initial_coefficient
+            self._basepoint = Vector(basepoint_coords, backend=self.backend)
+
+        except Exception as e:
+            if str(e) == Hyperplane.NO_NONZERO_ELEMENTS_FOUND_MSG:
+                self._basepoint = None
+            else:
+                raise e
+        self._has_basepoint = True
+
+    def __eq__(self, p):
+        if self.basepoint is None or p.basepoint is None:
+            return (
+                self.basepoint is None
+                and p.basepoint is None
+                and is_near_zero(self.constant_term - p.constant_term)
+            )
+        if is_parallel(self.normal_vector, p.normal_vector):
+            direction_vector = minus(self.basepoint, p.basepoint)
+            return is_orthogonal(direction_vector, self.normal_vector)
+        return False
+
+    def __str__(self):
+
+        num_decimal_places = 3
+
+        def write_coefficient(coefficient, is_initial_term=False):
+            coefficient = _display_number(coefficient, num_decimal_places)
+
+            output = ""
+
+            if coefficient < 0:
+                output += "-"
+            if coefficient > 0 and not is_initial_term:
+                output += "+"
+
+            if not is_initial_term:
+                output += " "
+
+            if abs(coefficient) != 1:
+                output += "{}".format(abs(coefficient))
+
+            return output
+
+        n = self.normal_vector.coordinates
+
+        try:
+            initial_index = Hyperplane.first_nonzero_index(n)
+            terms = [
+                write_coefficient(n[i], is_initial_term=(i == initial_index))
+                + "x_{}".format(i + 1)
+                for i in range(self.dimension)
+                if round(n[i], num_decimal_places) != 0
+            ]
+            output = " ".join(terms)
+
+        except Exception as e:
+            if str(e) == self.NO_NONZERO_ELEMENTS_FOUND_MSG:
+                output = "0"
+            else:
+                raise e
+
+        constant = _display_number(self.constant_term, num_decimal_places)
+        output += " = {}".format(constant)
+
+        return output
+
+    @staticmethod
+    def first_nonzero_index(iterable):
+        for k, item in enumerate(iterable):
+            if not is_near_zero(item):
+                return k
+        raise Exception(Hyperplane.NO_NONZERO_ELEMENTS_FOUND_MSG)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Linear systems that are reduced one equation at a time.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from .backend import get_backend, is_near_zero
+from .linsys import LinearSystem
+
+__all__ = ["REDUNDANT", "INCONSISTENT", "NARROWED", "IncrementalLinearSystem"]
+
+REDUNDANT = "redundant"
+INCONSISTENT = "inconsistent"
+NARROWED = "narrowed"
+
+
+class IncrementalLinearSystem(object):
+    """Keep a stream of equations in reduced row echelon form.
+
+    Every appended equation is reduced against the rows kept so far,
+    which costs ``O(n * k)`` for ``n`` variables and rank ``k``, instead
+    of eliminating the whole system again.
+
+    Parameters
+    ----------
+    planes : iterable, optional
+        Initial equations (``Line``, ``Plane``...).
+    backend : str or Backend, optional
+        Numeric backend. By default, the backend of the first equation.
+    """
+
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = (
+        LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG
+    )
+    NO_EQUATIONS_MSG = "No equations were received"
+
+    def __init__(self, planes=(), backend=None):
+        self.backend = None if backend is None else get_backend(backend)
+        self.dimension = None
+        self.num_equations = 0
+        self.is_consistent = True
+        self._plane_type = None
+        # pivot column -> row normalized so that the pivot is one and
+        # every other pivot column is zero
+        self._pivot_rows = {}
+        self.extend(planes)
+
+    @classmethod
+    def from_linear_system(cls, system):
+        return cls(system.planes, backend=system.backend)
+
+    @property
+    def rank(self):
+        return len(self._pivot_rows)
+
+    def __len__(self):
+        return self.num_equations
+
+    def _row_from_plane(self, plane):
+        if self.dimension is None:
+            self.dimension = plane.dimension
+            self._plane_type = type(plane)
+            if self.backend is None:
+                self.backend = plane.backend
+        elif plane.dimension != self.dimension:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+        convert = self.backend.convert
+        row = [convert(x) for x in plane.normal_vector.coordinates]
+        row.append(convert(plane.constant_term))
+        return row
+
+    def append(self, plane) -> str:
+        """Add one equation and report its effect on the solution set.
+
+        Returns
+        -------
+        str
+            ``REDUNDANT`` if it was implied by the previous equations,
+            ``INCONSISTENT`` if it contradicts them, or ``NARROWED`` if
+            it reduced the solution space.
+        """
+        row = self._row_from_plane(plane)
+        self.num_equations += 1
+        with self.backend.local_context():
+            for col, pivot_row in self._pivot_rows.items():
+                c = row[col]
+                if c:
+                    row = [v - c * p for v, p in zip(row, pivot_row)]
+
+            col = next(
+                (j for j in range(self.dimension) if not is_near_zero(row[j])),
+                None,
+            )
+            if col is None:
+                if is_near_zero(row[-1]):
+                    return REDUNDANT
+                self.is_consistent = False
+                return INCONSISTENT
+
+            pivot = row[col]
+            row = [v / pivot for v in row]
+            for other, pivot_row in self._pivot_rows.items():
+                c = pivot_row[col]
+                if c:
+                    self._pivot_rows[other] = [
+                        p - c * v for p, v in zip(pivot_row, row)
+                    ]
+            self._pivot_rows[col] = row
+        return NARROWED
+
+    def extend(self, planes) -> list:
+        """Append many equations, returning the status of each one."""
+        return [self.append(plane) for plane in planes]
+
+    def to_linear_system(self) -> LinearSystem:
+        """The reduced equations as a ``LinearSystem`` in RREF."""
+        if self.dimension is None:
+            raise Exception(self.NO_EQUATIONS_MSG)
+        rows = [self._pivot_rows[col] for col in sorted(self._pivot_rows)]
+        if not rows:
+            rows = [[self.backend.convert(0)] * (self.dimension + 1)]
+        return LinearSystem.from_rows(
+            rows, backend=self.backend, plane_type=self._plane_type
+        )
+
+    def solve(self, parametrize=True):
+        """Solve the equations received so far, like
+        ``LinearSystem.solve``, without any further elimination.
+        """
+        if self.dimension is None:
+            raise Exception(self.NO_EQUATIONS_MSG)
+        if not self.is_consistent:
+            raise Exception(LinearSystem.NO_SOLUTIONS_MSG)
+        with self.backend.local_context():
+            return self.to_linear_system()._extract_solution(parametrize)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Iterative solvers (Jacobi, Gauss-Seidel/SOR and conjugate gradient) for
+large square systems.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from collections import namedtuple
+
+import numpy as np
+
+from .backend import DEFAULT_TOLERANCE
+from .lu import LUFactorization
+from .vector import Vector
+
+__all__ = [
+    "ZERO_ON_THE_DIAGONAL_MSG",
+    "MATRIX_MUST_BE_SYMMETRIC_MSG",
+    "INITIAL_GUESS_DIMENSION_MSG",
+    "RELAXATION_FACTOR_MSG",
+    "DEFAULT_MAX_ITERATIONS",
+    "IterativeResult",
+    "jacobi",
+    "gauss_seidel",
+    "conjugate_gradient",
+]
+
+ZERO_ON_THE_DIAGONAL_MSG = "Some coefficient of the diagonal is zero"
+MATRIX_MUST_BE_SYMMETRIC_MSG = "The coefficient matrix must be symmetric"
+INITIAL_GUESS_DIMENSION_MSG = (
+    "The initial guess must have one value per variable"
+)
+RELAXATION_FACTOR_MSG = "The relaxation factor must be in (0, 2), got {}"
+
+DEFAULT_MAX_ITERATIONS = 1000
+
+IterativeResult = namedtuple(
+    "IterativeResult", ["solution", "converged", "iterations", "residuals"]
+)
+IterativeResult.__doc__ = """Outcome of an iterative solver.
+
+``residuals`` holds the 2-norm of ``b - A x`` after every iteration.
+"""
+
+
+def _setup(system, x0):
+    a, b = system.to_arrays()
+    n = len(b)
+    if a.shape != (n, n):
+        raise Exception(LUFactorization.SYSTEM_MUST_BE_SQUARE_MSG)
+    if x0 is None:
+        x = np.zeros(n)
+    else:
+        if isinstance(x0, Vector):
+            x0 = x0.coordinates
+        x = np.array(x0, dtype=np.float64)
+        if x.shape != (n,):
+            raise ValueError(INITIAL_GUESS_DIMENSION_MSG)
+    return a, b, x
+
+
+def _threshold(b, tolerance):
+    _tolerance = DEFAULT_TOLERANCE if tolerance is None else tolerance
+    scale = np.linalg.norm(b)
+    return _tolerance * scale if scale else _tolerance
+
+
+def _result(system, x, converged, residuals):
+    solution = Vector(x.tolist(), backend=system.backend)
+    return IterativeResult(solution, converged, len(residuals), residuals)
+
+
+def jacobi(
+    system, tolerance=None, max_iterations=DEFAULT_MAX_ITERATIONS, x0=None
+) -> IterativeResult:
+    """Jacobi iteration, converges for diagonally dominant systems.
+
+    Parameters
+    ----------
+    system : LinearSystem
+        A square system.
+    tolerance : float, optional
+        Stop when the residual norm is below ``tolerance`` times the norm
+        of the constant terms.
+    max_iterations : int, optional
+    x0 : Vector or sequence, optional
+        Initial guess, e.g. the solution of a previous, similar system.
+    """
+    a, b, x = _setup(system, x0)
+    diagonal = np.diag(a)
+    if not np.all(diagonal):
+        raise Exception(ZERO_ON_THE_DIAGONAL_MSG)
+    threshold = _threshold(b, tolerance)
+    residuals = []
+    residual = b - a @ x
+    for _ in range(max_iterations):
+        x = x + residual / diagonal
+        residual = b - a @ x
+        residuals.append(float(np.linalg.norm(residual)))
+        if residuals[-1] <= threshold:
+            return _result(system, x, True, residuals)
+    return _result(system, x, False, residuals)
+
+
+def gauss_seidel(
+    system,
+    tolerance=None,
+    max_iterations=DEFAULT_MAX_ITERATIONS,
+    x0=None,
+    omega=1.0,
+) -> IterativeResult:
+    """Gauss-Seidel iteration, or successive over-relaxation (SOR) when
+    ``omega`` is not one.
+
+    Same parameters as ``jacobi`` plus the relaxation factor ``omega``,
+    which must be in ``(0, 2)``.
+    """
+    if not 0 < omega < 2:
+        raise ValueError(RELAXATION_FACTOR_MSG.format(omega))
+    a, b, x = _setup(system, x0)
+    diagonal = np.diag(a)
+    if not np.all(diagonal):
+        raise Exception(ZERO_ON_THE_DIAGONAL_MSG)
+    threshold = _threshold(b, tolerance)
+    residuals = []
+    for _ in range(max_iterations):
+        for i in range(len(b)):
+            sigma = a[i] @ x - diagonal[i] * x[i]
+            x[i] += omega * ((b[i] - sigma) / diagonal[i] - x[i])
+        residuals.append(float(np.linalg.norm(b - a @ x)))
+        if residuals[-1] <= threshold:
+            return _result(system, x, True, residuals)
+    return _result(system, x, False, residuals)
+
+
+def conjugate_gradient(
+    system, tolerance=None, max_iterations=DEFAULT_MAX_ITERATIONS, x0=None
+) -> IterativeResult:
+    """Conjugate gradient method for symmetric positive-definite systems.
+
+    Same parameters as ``jacobi``. In exact arithmetic it converges in
+    at most ``n`` iterations.
+    """
+    a, b, x = _setup(system, x0)
+    if not np.allclose(a, a.T):
+        raise Exception(MATRIX_MUST_BE_SYMMETRIC_MSG)
+    threshold = _threshold(b, tolerance)
+    residuals = []
+    residual = b - a @ x
+    direction = residual.copy()
+    squared_norm = residual @ residual
+    if np.sqrt(squared_norm) <= threshold:
+        return _result(system, x, True, residuals)
+    for _ in range(max_iterations):
+        image = a @ direction
+        step = squared_norm / (direction @ image)
+        x += step * direction
+        residual -= step * image
+        new_squared_norm = residual @ residual
+        residuals.append(float(np.sqrt(new_squared_norm)))
+        if residuals[-1] <= threshold:
+            return _result(system, x, True, residuals)
+        direction = residual + (new_squared_norm / squared_norm) * direction
+        squared_norm = new_squared_norm
+    return _result(system, x, False, residuals)
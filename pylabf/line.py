@@ -20,18 +20,16 @@ Functions is python for the most commun basic linear algebra operations.
 # IMPORTS
 # =============================================================================
 
-from decimal import Decimal, getcontext
+from .hyperplane import Hyperplane
+from .vector import Vector, is_parallel
 
-from .linsys import MyDecimal
-from .vector import Vector, is_parallel, is_orthogonal, minus
+__all__ = ["Line", "intersection"]
 
 
-getcontext().prec = 30
+class Line(Hyperplane):
+    """A hyperplane of the plane, i.e. a line in two dimensions."""
 
-
-class Line(object):
-
-    NO_NONZERO_ELTS_FOUND_MSG = "No nonzero elements found"
+    NO_NONZERO_ELTS_FOUND_MSG = Hyperplane.NO_NONZERO_ELEMENTS_FOUND_MSG
     THEY_ARE_PARALLEL_AND_DONT_INTERSECT_MSG = (
         "They are parallel and never intersect."
     )
@@ -39,105 +37,8 @@ class Line(object):
         "Has infinite intersections because they are the same line."
     )
 
-    def __init__(self, normal_vector=None, constant_term=None):
-        self.dimension = 2
-
-        if not normal_vector:
-            all_zeros = ["0"] * self.dimension
-            normal_vector = all_zeros
-
-        self.normal_vector = (
-            Vector(normal_vector)
-            if isinstance(normal_vector, list)
-            else normal_vector
-        )
-
-        if not constant_term:
-            constant_term = Decimal("0")
-
-        self.constant_term = Decimal(constant_term)
-
-        self.set_basepoint()
-
-    def set_basepoint(self):
-        try:
-            n = self.normal_vector.coordinates
-            c = self.constant_term
-            basepoint_coords = ["0"] * self.dimension
-
-            initial_index = Line.first_nonzero_index(n)
-            initial_coefficient = n[initial_index]
-
-            basepoint_coords[initial_index] = c / initial_coefficient
-            self.basepoint = Vector(basepoint_coords)
-
-        except Exception as e:
-            if str(e) == Line.NO_NONZERO_ELTS_FOUND_MSG:
-                self.basepoint = None
-            else:
-                raise e
-
-    def __eq__(self, l):
-        if is_parallel(self.normal_vector, l.normal_vector):
-            direction_vector = minus(self.basepoint, l.basepoint)
-            return is_orthogonal(direction_vector, self.normal_vector)
-        return False
-
-    def __str__(self):
-
-        num_decimal_places = 3
-
-        def write_coefficient(coefficient, is_initial_term=False):
-            coefficient = round(coefficient, num_decimal_places)
-            if coefficient % 1 == 0:
-                coefficient = int(coefficient)
-
-            output = ""
-
-            if coefficient < 0:
-                output += "-"
-            if coefficient > 0 and not is_initial_term:
-                output += "+"
-
-            if not is_initial_term:
-                output += " "
-
-            if abs(coefficient) != 1:
-                output += "{}".format(abs(coefficient))
-
-            return output
-
-        n = self.normal_vector.coordinates
-
-        try:
-            initial_index = Line.first_nonzero_index(n)
-            terms = [
-                write_coefficient(n[i], is_initial_term=(i == initial_index))
-                + "x_{}".format(i + 1)
-                for i in range(self.dimension)
-                if round(n[i], num_decimal_places) != 0
-            ]
-            output = " ".join(terms)
-
-        except Exception as e:
-            if str(e) == self.NO_NONZERO_ELTS_FOUND_MSG:
-                output = "0"
-            else:
-                raise e
-
-        constant = round(self.constant_term, num_decimal_places)
-        if constant % 1 == 0:
-            constant = int(constant)
-        output += " = {}".format(constant)
-
-        return output
-
-    @staticmethod
-    def first_nonzero_index(iterable):
-        for k, item in enumerate(iterable):
-            if not MyDecimal(item).is_near_zero():
-                return k
-        raise Exception(Line.NO_NONZERO_ELTS_FOUND_MSG)
+    def __init__(self, normal_vector=None, constant_term=None, backend=None):
+        super().__init__(normal_vector, constant_term, backend, dimension=2)
 
 
 def intersection(vect1: Vector, vect2: Vector) -> Vector:
@@ -151,4 +52,4 @@ def intersection(vect1: Vector, vect2: Vector) -> Vector:
     k2 = vect2.constant_term
     x = (D * k1 - B * k2) / (A * D - B * C)
     y = (A * k2 - C * k1) / (A * D - B * C)
-    return Vector([x, y])
+    return Vector([x, y], backend=vect1.backend)
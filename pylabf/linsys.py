@@ -20,13 +20,42 @@ Functions is python for the most commun basic linear algebra operations.
 # IMPORTS
 # =============================================================================
 
-from decimal import Decimal, getcontext
-from copy import deepcopy
-
-from .vector import plus, times_scalar
-from .plane import Plane
-
-getcontext().prec = 30
+from collections import namedtuple
+
+import numpy as np
+
+from .backend import get_backend, is_near_zero
+from .lu import (
+    FIRST_NONZERO,
+    PARTIAL,
+    SCALED,
+    LUFactorization,
+    check_pivoting,
+    row_scales,
+    select_pivot,
+)
+from .hyperplane import Hyperplane, _display_number
+from .line import Line
+
+# MyDecimal is re-exported for backward compatibility
+from .plane import MyDecimal, Plane
+from .vector import Vector
+from .tracing import ADD_MULTIPLE, SCALE, SWAP, RowOperation, trace_phase
+
+__all__ = [
+    "PLANE_TYPES",
+    "EchelonForm",
+    "LinearSystem",
+    "Parametrization",
+    "MyDecimal",
+]
+
+PLANE_TYPES = {2: Line, 3: Plane}
+
+# Row echelon form of the coefficients shared by rank, determinant and
+# nullspace: the echelon rows, their pivot columns and the sign of the
+# row permutation.
+EchelonForm = namedtuple("EchelonForm", ["rows", "pivots", "sign"])
 
 
 class LinearSystem(object):
@@ -37,84 +66,222 @@ class LinearSystem(object):
     NO_SOLUTIONS_MSG = "No solutions"
     INF_SOLUTIONS_MSG = "Infinitely many solutions"
     SOME_VALUES_ARE_ZERO_MSG = "Some of the values provided are zero"
+    DETERMINANT_ONLY_FOR_SQUARE_SYSTEMS_MSG = (
+        "The determinant is only defined for square systems"
+    )
+
+    # Callable receiving a RowOperation for every row operation and a
+    # Phase for every elimination phase (see pylabf.tracing).
+    observer = None
 
-    def __init__(self, planes):
+    def __init__(self, planes, backend=None, observer=None):
         try:
             d = planes[0].dimension
             for p in planes:
                 assert p.dimension == d
 
-            self.planes = planes
+            self.backend = (
+                planes[0].backend if backend is None else get_backend(backend)
+            )
             self.dimension = d
+            self._plane_type = type(planes[0])
+            self._cache = {}
+            self._set_planes(planes)
+            if observer is not None:
+                self.observer = observer
 
         except AssertionError:
             raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
 
+    @classmethod
+    def from_rows(cls, rows, backend=None, plane_type=None, observer=None):
+        """Build a system from augmented rows ``[a_1, ..., a_n, k]``.
+
+        No equation object is built until one is requested. By default
+        they are ``Line`` or ``Plane`` in two or three dimensions and
+        ``Hyperplane`` otherwise.
+        """
+        try:
+            d = len(rows[0]) - 1
+            for row in rows:
+                assert len(row) - 1 == d
+
+            system = object.__new__(cls)
+            system.backend = get_backend(backend)
+            system.dimension = d
+            if plane_type is None:
+                plane_type = PLANE_TYPES.get(d, Hyperplane)
+            system._plane_type = plane_type
+            system._cache = {}
+            convert = system.backend.convert
+            system._rows = [[convert(v) for v in row] for row in rows]
+            system._shared = [False] * len(rows)
+            system._planes = [None] * len(rows)
+            if observer is not None:
+                system.observer = observer
+            return system
+
+        except AssertionError:
+            raise Exception(cls.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+    # The system is stored as an augmented matrix: one list per equation
+    # holding its coefficients followed by its constant term. Row
+    # operations update those lists in place and the Plane objects are
+    # only built (and cached) when a caller asks for them. Rows flagged
+    # in _shared may also belong to a fork of the system and are copied
+    # the first time they are written (copy-on-write).
+
+    def _invalidate(self):
+        if self._cache:
+            self._cache = {}
+
+    def _set_planes(self, planes):
+        self._invalidate()
+        self._rows = [self._row_from_plane(p) for p in planes]
+        self._shared = [False] * len(self._rows)
+        self._planes = [
+            p if p.backend is self.backend else None for p in planes
+        ]
+
+    def _row_from_plane(self, plane):
+        convert = self.backend.convert
+        row = [convert(x) for x in plane.normal_vector.coordinates]
+        row.append(convert(plane.constant_term))
+        return row
+
+    def _materialize(self, i):
+        plane = self._planes[i]
+        if plane is None:
+            row = self._rows[i]
+            plane = self._plane_type(row[:-1], row[-1], backend=self.backend)
+            self._planes[i] = plane
+        return plane
+
+    def _write_row(self, i, values):
+        if self._shared[i]:
+            self._rows[i] = values
+            self._shared[i] = False
+        else:
+            self._rows[i][:] = values
+        self._planes[i] = None
+        self._invalidate()
+
+    def fork(self):
+        """Cheap working copy of the system.
+
+        The fork shares every row with the original. Whichever of the
+        two modifies a row first gets its own copy of that row, so the
+        other one never sees the change.
+        """
+        system = object.__new__(type(self))
+        system.__dict__.update(self.__dict__)
+        self._shared = [True] * len(self._rows)
+        system._rows = self._rows[:]
+        system._shared = self._shared[:]
+        system._planes = self._planes[:]
+        system._cache = {}
+        return system
+
+    @property
+    def planes(self):
+        """The equations as a tuple built from the current rows.
+
+        It is a snapshot, so it is read-only: assign a whole sequence to
+        ``planes`` or replace one equation with ``system[i] = plane``.
+        """
+        return tuple([self._materialize(i) for i in range(len(self))])
+
+    @planes.setter
+    def planes(self, planes):
+        self._set_planes(planes)
+
     def swap_rows(self, row1, row2):
-        row1_content = self.planes[row1]
-        row2_content = self.planes[row2]
-        self.planes[row2] = row1_content
-        self.planes[row1] = row2_content
-        pass
+        rows, planes, shared = self._rows, self._planes, self._shared
+        rows[row1], rows[row2] = rows[row2], rows[row1]
+        planes[row1], planes[row2] = planes[row2], planes[row1]
+        shared[row1], shared[row2] = shared[row2], shared[row1]
+        self._invalidate()
+        if self.observer is not None:
+            self.observer(RowOperation(SWAP, (row1, row2), None))
 
     def multiply_coefficient_and_row(self, coefficient, row):
-        normal_vector_multiplied = self.planes[row].normal_vector.times_scalar(
-            coefficient
-        )
-        constant_term_multiplied = self.planes[row].constant_term * coefficient
-        self.planes[row] = Plane(
-            normal_vector_multiplied.coordinates, constant_term_multiplied
-        )
-        pass
+        coefficient = self.backend.convert(coefficient)
+        values = self._rows[row]
+        with self.backend.local_context():
+            values = [coefficient * v for v in values]
+        self._write_row(row, values)
+        if self.observer is not None:
+            self.observer(RowOperation(SCALE, (row,), coefficient))
 
     def add_multiple_times_row_to_row(
-        self, coefficient, row_to_add, row_to_be_added_to
+        self, coefficient, row_to_add, row_to_be_added_to, clear_column=None
     ):
-        # get the plain to add
-        n1 = self.planes[row_to_add].normal_vector
-        k1 = self.planes[row_to_add].constant_term
-        # get the plane to be added
-        n2 = self.planes[row_to_be_added_to].normal_vector
-        k2 = self.planes[row_to_be_added_to].constant_term
-
-        # convine the rows
-        n = plus(times_scalar(n1, coefficient), n2)
-        print("-----------------------------------------")
-        print(n.coordinates)
-        print("-----------------------------------------")
-        k = (k1 * coefficient) + k2
-        # replace plane
-        print(Plane(n.coordinates, k))
-        self.planes[row_to_be_added_to] = Plane(n.coordinates, k)
-        pass
+        """Add ``coefficient`` times a row to another one.
+
+        ``clear_column`` is the column the operation eliminates, if any.
+        It is stored as an exact zero instead of the rounding residue, so
+        it can't be taken as a pivot later.
+        """
+        coefficient = self.backend.convert(coefficient)
+        # get the row to add and the row to be added to
+        source = self._rows[row_to_add]
+        target = self._rows[row_to_be_added_to]
+
+        # convine the rows in place
+        with self.backend.local_context():
+            values = [coefficient * v1 + v2 for v1, v2 in zip(source, target)]
+        if clear_column is not None:
+            values[clear_column] = self.backend.convert(0)
+        self._write_row(row_to_be_added_to, values)
+        if self.observer is not None:
+            self.observer(
+                RowOperation(
+                    ADD_MULTIPLE, (row_to_add, row_to_be_added_to), coefficient
+                )
+            )
+
+    def to_arrays(self):
+        """Coefficients and constant terms as float64 arrays.
+
+        Returns
+        -------
+        coefficients, constants : numpy.ndarray
+            Arrays of shape ``(len(system), dimension)`` and
+            ``(len(system),)``.
+        """
+        augmented = np.array(self._rows, dtype=np.float64).reshape(
+            len(self), self.dimension + 1
+        )
+        return augmented[:, :-1].copy(), augmented[:, -1].copy()
 
     def indices_of_first_nonzero_terms_in_each_row(self):
-        num_equations = len(self)
         num_variables = self.dimension
 
-        indices = [-1] * num_equations
+        indices = [-1] * len(self)
 
-        for i, p in enumerate(self.planes):
-            try:
-                indices[i] = p.first_nonzero_index(p.normal_vector.coordinates)
-            except Exception as e:
-                if str(e) == Plane.NO_NONZERO_ELTS_FOUND_MSG:
-                    continue
-                else:
-                    raise e
+        for i, row in enumerate(self._rows):
+            for j in range(num_variables):
+                if not is_near_zero(row[j]):
+                    indices[i] = j
+                    break
 
         return indices
 
     def __len__(self):
-        return len(self.planes)
+        return len(self._rows)
 
     def __getitem__(self, i):
-        return self.planes[i]
+        if isinstance(i, slice):
+            return [self._materialize(k) for k in range(len(self))[i]]
+        return self._materialize(range(len(self))[i])
 
     def __setitem__(self, i, x):
         try:
             assert x.dimension == self.dimension
-            self.planes[i] = x
+            self._rows[i] = self._row_from_plane(x)
+            self._shared[i] = False
+            self._planes[i] = x if x.backend is self.backend else None
+            self._invalidate()
 
         except AssertionError:
             raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
@@ -128,23 +295,41 @@ class LinearSystem(object):
         ret += "\n".join(temp)
         return ret
 
-    def compute_triangular_form(self):
-        system = deepcopy(self)
+    def compute_triangular_form(self, pivoting=FIRST_NONZERO):
+        """Row echelon form of the system, computed on a working copy.
+
+        ``pivoting`` selects the pivot row of each column: the first
+        coefficient that is not near zero (``"first_nonzero"``, fine in
+        exact arithmetic), or the largest one in absolute value, plain
+        (``"partial"``) or relative to its row (``"scaled"``), which is
+        what keeps float64 elimination stable.
+        """
+        with self.backend.local_context():
+            with trace_phase(self.observer, "triangular_form"):
+                return self._compute_triangular_form(pivoting)
+
+    def _compute_triangular_form(self, pivoting=FIRST_NONZERO):
+        check_pivoting(pivoting)
+        system = self.fork()
 
         num_equations = len(system)
         num_variables = system.dimension
+        rows = system._rows
+        scales = None
+        if pivoting == SCALED:
+            scales = row_scales(rows, num_variables)
 
         j = 0
         for i in range(num_equations):
             while j < num_variables:
-                c = MyDecimal(system[i].normal_vector.coordinates[j])
-                if c.is_near_zero():
-                    swap_succeeded = system.swap_with_row_below_for_nonzero_coefficient_if_able(
-                        i, j
-                    )
-                    if not swap_succeeded:
-                        j += 1
-                        continue
+                k = select_pivot(rows, i, j, pivoting, scales)
+                if is_near_zero(rows[k][j]):
+                    j += 1
+                    continue
+                if k != i:
+                    system.swap_rows(i, k)
+                    if scales is not None:
+                        scales[i], scales[k] = scales[k], scales[i]
 
                 system.clear_coefficients_below(i, j)
 
@@ -153,32 +338,210 @@ class LinearSystem(object):
 
         return system
 
+    def lu_factorization(self, pivoting=PARTIAL):
+        """Cached ``LUFactorization`` of the coefficient matrix.
+
+        It is computed on the first call and reused until a row of the
+        system changes.
+        """
+        key = ("lu", pivoting)
+        lu = self._cache.get(key)
+        if lu is None:
+            lu = self._cache[key] = LUFactorization(self, pivoting)
+        return lu
+
+    def compute_rref(self, pivoting=FIRST_NONZERO):
+        with self.backend.local_context():
+            with trace_phase(self.observer, "triangular_form"):
+                system = self._compute_triangular_form(pivoting)
+            with trace_phase(self.observer, "rref"):
+                system._reduce_triangular_form()
+        return system
+
+    def _reduce_triangular_form(self):
+        rows = self._rows
+        pivots = self.indices_of_first_nonzero_terms_in_each_row()
+        for i in reversed(range(len(self))):
+            j = pivots[i]
+            if j < 0:
+                continue
+            if rows[i][j] != 1:
+                self.multiply_coefficient_and_row(1 / rows[i][j], i)
+            for k in range(i):
+                gamma = rows[k][j]
+                if gamma:
+                    self.add_multiple_times_row_to_row(-gamma, i, k)
+
+    def echelon_form(self) -> EchelonForm:
+        """Cached row echelon form of the coefficients.
+
+        It is computed with partial pivoting on the first call and
+        reused until a row of the system changes.
+        """
+        echelon = self._cache.get("echelon")
+        if echelon is not None:
+            return echelon
+
+        num_variables = self.dimension
+        rows = [row[:-1] for row in self._rows]
+        pivots = []
+        sign = 1
+        zero = self.backend.convert(0)
+        i = 0
+        with self.backend.local_context():
+            for j in range(num_variables):
+                if i == len(rows):
+                    break
+                k = select_pivot(rows, i, j, PARTIAL)
+                if is_near_zero(rows[k][j]):
+                    continue
+                if k != i:
+                    rows[i], rows[k] = rows[k], rows[i]
+                    sign = -sign
+                beta = rows[i][j]
+                for r in range(i + 1, len(rows)):
+                    gamma = rows[r][j]
+                    if not gamma:
+                        continue
+                    alpha = gamma / beta
+                    rows[r] = [v - alpha * p for v, p in zip(rows[r], rows[i])]
+                    rows[r][j] = zero
+                pivots.append(j)
+                i += 1
+
+        echelon = self._cache["echelon"] = EchelonForm(rows, pivots, sign)
+        return echelon
+
+    def rank(self) -> int:
+        """Number of linearly independent equations."""
+        return len(self.echelon_form().pivots)
+
+    def determinant(self):
+        """Determinant of the coefficient matrix of a square system."""
+        if len(self) != self.dimension:
+            raise Exception(self.DETERMINANT_ONLY_FOR_SQUARE_SYSTEMS_MSG)
+        rows, pivots, sign = self.echelon_form()
+        if len(pivots) < self.dimension:
+            return self.backend.convert(0)
+        with self.backend.local_context():
+            determinant = self.backend.convert(sign)
+            for i, row in enumerate(rows):
+                determinant *= row[i]
+        return determinant
+
+    def nullspace(self) -> list:
+        """Basis of the solutions of the homogeneous system ``A x = 0``.
+
+        There is one ``Vector`` per free variable, empty list if the
+        only solution is zero.
+        """
+        rows, pivots, _ = self.echelon_form()
+        convert = self.backend.convert
+        free = [j for j in range(self.dimension) if j not in set(pivots)]
+        basis = []
+        with self.backend.local_context():
+            for f in free:
+                x = [convert(0)] * self.dimension
+                x[f] = convert(1)
+                for i in reversed(range(len(pivots))):
+                    j = pivots[i]
+                    row = rows[i]
+                    s = sum([row[c] * x[c] for c in range(j + 1, len(x))])
+                    x[j] = -s / row[j]
+                basis.append(Vector(x, backend=self.backend))
+        return basis
+
+    def solve(self, parametrize=True, pivoting=FIRST_NONZERO, refine=0):
+        """Solve the system on the in-place elimination path.
+
+        Returns the solution ``Vector`` when it is unique. When there
+        are infinitely many solutions, returns a ``Parametrization``
+        (or raises if ``parametrize`` is False). Inconsistent systems
+        raise ``NO_SOLUTIONS_MSG``.
+
+        With ``refine > 0`` a square nonsingular system is solved with
+        the cached ``LUFactorization`` (``pivoting="first_nonzero"``
+        becomes partial pivoting) followed by that many rounds of
+        iterative refinement. That is how float64 systems get close to
+        the accuracy of the Decimal backend.
+        """
+        if refine and len(self) == self.dimension:
+            lu_pivoting = PARTIAL if pivoting == FIRST_NONZERO else pivoting
+            try:
+                lu = self.lu_factorization(lu_pivoting)
+            except Exception as e:
+                if str(e) != LUFactorization.SINGULAR_MATRIX_MSG:
+                    raise e
+            else:
+                constants = [row[-1] for row in self._rows]
+                with trace_phase(self.observer, "solve"):
+                    return lu.solve(constants, refine)
+        with self.backend.local_context():
+            rref = self.compute_rref(pivoting)
+            with trace_phase(self.observer, "solve"):
+                return rref._extract_solution(parametrize)
+
+    def _extract_solution(self, parametrize):
+        pivots = self.indices_of_first_nonzero_terms_in_each_row()
+        rows = self._rows
+        for row, j in zip(rows, pivots):
+            if j < 0 and not is_near_zero(row[-1]):
+                raise Exception(self.NO_SOLUTIONS_MSG)
+
+        num_variables = self.dimension
+        convert = self.backend.convert
+        basepoint = [convert(0)] * num_variables
+        pivot_rows = {}
+        for i, j in enumerate(pivots):
+            if j >= 0:
+                basepoint[j] = rows[i][-1]
+                pivot_rows[j] = rows[i]
+
+        if len(pivot_rows) == num_variables:
+            return Vector(basepoint, backend=self.backend)
+        if not parametrize:
+            raise Exception(self.INF_SOLUTIONS_MSG)
+
+        direction_vectors = []
+        for free in range(num_variables):
+            if free in pivot_rows:
+                continue
+            direction = [convert(0)] * num_variables
+            direction[free] = convert(1)
+            for j, row in pivot_rows.items():
+                direction[j] = -row[free]
+            direction_vectors.append(Vector(direction, backend=self.backend))
+
+        return Parametrization(
+            Vector(basepoint, backend=self.backend), direction_vectors
+        )
+
     def swap_with_row_below_for_nonzero_coefficient_if_able(self, row, col):
-        num_equations = len(self)
-        for k in range(row + 1, num_equations):
-            coefficient = MyDecimal(self[k].normal_vector.coordinates[col])
-            if not coefficient.is_near_zero():
+        rows = self._rows
+        for k in range(row + 1, len(self)):
+            if not is_near_zero(rows[k][col]):
                 self.swap_rows(row, k)
                 return True
         return False
 
     def clear_coefficients_below(self, row, col):
-        num_equations = len(self)
-        beta = MyDecimal(self[row].normal_vector.coordinates[col])
-        for k in range(row + 1, num_equations):
-            n = self[k].normal_vector.coordinates
-            gamma = n[col]
+        rows = self._rows
+        beta = rows[row][col]
+        for k in range(row + 1, len(self)):
+            gamma = rows[k][col]
+            if not gamma:
+                continue
             alpha = -gamma / beta
 
-            self.add_multiple_times_row_to_row(alpha, row, k)
+            self.add_multiple_times_row_to_row(alpha, row, k, clear_column=col)
 
     def __order_equations__(self):
-        planes_sorted = []
-        for indices, plane in sorted(
-            zip(self.indices_of_first_nonzero_terms_in_each_row(), self.planes)
-        ):
-            planes_sorted.append(plane)
-        self.planes = planes_sorted
+        indices = self.indices_of_first_nonzero_terms_in_each_row()
+        order = sorted(range(len(self)), key=indices.__getitem__)
+        self._rows = [self._rows[i] for i in order]
+        self._planes = [self._planes[i] for i in order]
+        self._shared = [self._shared[i] for i in order]
+        self._invalidate()
 
     def __are_different_symbol__(self, x, y):
         if x == 0 or y == 0:
@@ -193,7 +556,47 @@ class LinearSystem(object):
             return False
 
 
-class MyDecimal(Decimal):
-    def is_near_zero(self, eps=None):
-        _eps = 1e-10 if eps is None else eps
-        return abs(self) < _eps
+class Parametrization(object):
+    """Solution set ``basepoint + sum(t_i * direction_vectors[i])``."""
+
+    BASEPT_AND_DIR_VECTORS_MUST_BE_IN_SAME_DIM = (
+        "The basepoint and direction vectors should all live in the same "
+        "dimension"
+    )
+
+    def __init__(self, basepoint, direction_vectors):
+        self.basepoint = basepoint
+        self.direction_vectors = direction_vectors
+        self.dimension = self.basepoint.dimension
+
+        try:
+            for v in direction_vectors:
+                assert v.dimension == self.dimension
+
+        except AssertionError:
+            raise Exception(self.BASEPT_AND_DIR_VECTORS_MUST_BE_IN_SAME_DIM)
+
+    def __str__(self):
+
+        num_decimal_places = 3
+
+        def write_term(coefficient, name):
+            coefficient = _display_number(coefficient, num_decimal_places)
+            sign = "-" if coefficient < 0 else "+"
+            if abs(coefficient) == 1:
+                return "{} {}".format(sign, name)
+            return "{} {} {}".format(sign, abs(coefficient), name)
+
+        output = ""
+        for i in range(self.dimension):
+            constant = _display_number(
+                self.basepoint.coordinates[i], num_decimal_places
+            )
+            output += "x_{} = {}".format(i + 1, constant)
+            for k, v in enumerate(self.direction_vectors):
+                if round(v.coordinates[i], num_decimal_places) != 0:
+                    output += " " + write_term(
+                        v.coordinates[i], "t_{}".format(k + 1)
+                    )
+            output += "\n"
+        return output
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Least squares solutions of overdetermined systems read as a stream.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import itertools
+from collections import namedtuple
+
+import numpy as np
+
+from .backend import DEFAULT_TOLERANCE, get_backend
+from .linsys import LinearSystem
+from .vector import Vector
+
+__all__ = [
+    "DEFAULT_ROWS_PER_CHUNK",
+    "RANK_DEFICIENT_MSG",
+    "NO_EQUATIONS_MSG",
+    "LeastSquaresResult",
+    "StreamingLeastSquares",
+    "least_squares",
+]
+
+DEFAULT_ROWS_PER_CHUNK = 4096
+
+RANK_DEFICIENT_MSG = (
+    "The coefficients are rank deficient, the least squares solution is "
+    "not unique"
+)
+NO_EQUATIONS_MSG = "No equations were received"
+
+LeastSquaresResult = namedtuple(
+    "LeastSquaresResult", ["solution", "residual_norm"]
+)
+LeastSquaresResult.__doc__ = """Minimizer of ``||A x - b||`` and the
+2-norm of its residual.
+"""
+
+
+def _augmented_row(equation):
+    if hasattr(equation, "normal_vector"):
+        return list(equation.normal_vector.coordinates) + [
+            equation.constant_term
+        ]
+    return equation
+
+
+class StreamingLeastSquares(object):
+    """Accumulate equations into the ``R`` factor of the QR
+    decomposition of ``[A | b]``.
+
+    Every chunk of rows is stacked under the current ``R`` and reduced
+    again, so the memory is ``O(n^2)`` for ``n`` unknowns no matter how
+    many equations arrive.
+
+    Parameters
+    ----------
+    dimension : int, optional
+        Number of unknowns. By default, taken from the first equation.
+    chunk_size : int, optional
+        Equations reduced at a time.
+    backend : str or Backend, optional
+        Backend of the solution ``Vector``.
+    """
+
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = (
+        LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG
+    )
+
+    def __init__(
+        self, dimension=None, chunk_size=DEFAULT_ROWS_PER_CHUNK, backend=None
+    ):
+        self.dimension = dimension
+        self.chunk_size = chunk_size
+        self.backend = get_backend(backend)
+        self.num_equations = 0
+        self._r = None
+
+    def __len__(self):
+        return self.num_equations
+
+    def _update(self, rows):
+        chunk = np.array(rows, dtype=np.float64)
+        if self.dimension is None:
+            self.dimension = chunk.shape[1] - 1
+        if chunk.shape[1] != self.dimension + 1:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+        if self._r is not None:
+            chunk = np.vstack([self._r, chunk])
+        self._r = np.linalg.qr(chunk, mode="r")
+        self.num_equations += len(rows)
+
+    def extend(self, equations):
+        """Consume equations (``Plane``, ``Hyperplane``... or augmented
+        rows ``[a_1, ..., a_n, k]``) from any iterable, ``chunk_size``
+        at a time. A ``LinearSystem`` is read row by row.
+        """
+        if isinstance(equations, LinearSystem):
+            equations = equations._rows
+        iterator = map(_augmented_row, equations)
+        while True:
+            rows = list(itertools.islice(iterator, self.chunk_size))
+            if not rows:
+                return
+            self._update(rows)
+
+    def append(self, equation):
+        self._update([_augmented_row(equation)])
+
+    def solve(self, tolerance=None) -> LeastSquaresResult:
+        """Least squares solution of the equations received so far."""
+        if self._r is None:
+            raise Exception(NO_EQUATIONS_MSG)
+        _tolerance = DEFAULT_TOLERANCE if tolerance is None else tolerance
+        n = self.dimension
+        r = self._r
+        if len(r) < n:
+            raise Exception(RANK_DEFICIENT_MSG)
+        diagonal = np.abs(np.diag(r[:n, :n]))
+        if not n or diagonal.min() <= _tolerance * diagonal.max():
+            raise Exception(RANK_DEFICIENT_MSG)
+        x = np.linalg.solve(np.triu(r[:n, :n]), r[:n, n])
+        residual_norm = float(abs(r[n, n])) if len(r) > n else 0.0
+        return LeastSquaresResult(
+            Vector(x.tolist(), backend=self.backend), residual_norm
+        )
+
+
+def least_squares(
+    equations, chunk_size=DEFAULT_ROWS_PER_CHUNK, backend=None, tolerance=None
+) -> LeastSquaresResult:
+    """Solve an overdetermined system in the least squares sense.
+
+    ``equations`` is any iterable accepted by
+    ``StreamingLeastSquares.extend``, e.g. a generator of millions of
+    planes, and is consumed in chunks of ``chunk_size``.
+    """
+    if backend is None and isinstance(equations, LinearSystem):
+        backend = equations.backend
+    accumulator = StreamingLeastSquares(chunk_size=chunk_size, backend=backend)
+    accumulator.extend(equations)
+    return accumulator.solve(tolerance)
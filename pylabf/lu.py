@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+LU factorization of the coefficient matrix of a LinearSystem.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from .backend import DecimalBackend, is_near_zero
+from .vector import Vector
+
+__all__ = [
+    "FIRST_NONZERO",
+    "PARTIAL",
+    "SCALED",
+    "PIVOTING_STRATEGIES",
+    "UNKNOWN_PIVOTING_MSG",
+    "RESIDUAL_BACKEND",
+    "check_pivoting",
+    "row_scales",
+    "select_pivot",
+    "LUFactorization",
+]
+
+FIRST_NONZERO = "first_nonzero"
+PARTIAL = "partial"
+SCALED = "scaled"
+PIVOTING_STRATEGIES = (FIRST_NONZERO, PARTIAL, SCALED)
+
+UNKNOWN_PIVOTING_MSG = "Unknown pivoting strategy: {}"
+
+# Residuals of the iterative refinement are accumulated with twice the
+# digits of a float64 product so that they are not lost to rounding.
+RESIDUAL_BACKEND = DecimalBackend(precision=64)
+
+
+def check_pivoting(pivoting):
+    if pivoting not in PIVOTING_STRATEGIES:
+        raise ValueError(UNKNOWN_PIVOTING_MSG.format(pivoting))
+    return pivoting
+
+
+def row_scales(rows, num_variables):
+    """Largest coefficient of each row, used by scaled partial pivoting."""
+    scales = []
+    for row in rows:
+        scale = max([abs(v) for v in row[:num_variables]], default=0)
+        scales.append(scale if scale else 1)
+    return scales
+
+
+def select_pivot(rows, row, col, pivoting, scales=None):
+    """Index of the pivot row for column ``col`` among rows ``row...``.
+
+    ``first_nonzero`` picks the first coefficient that is not near zero
+    (the exact arithmetic choice), ``partial`` the largest one in
+    absolute value and ``scaled`` the largest one relative to the
+    largest coefficient of its row.
+    """
+    candidates = range(row, len(rows))
+    if pivoting == FIRST_NONZERO:
+        for k in candidates:
+            if not is_near_zero(rows[k][col]):
+                return k
+        return row
+    if pivoting == PARTIAL:
+        return max(candidates, key=lambda k: abs(rows[k][col]))
+    return max(candidates, key=lambda k: abs(rows[k][col]) / scales[k])
+
+
+class LUFactorization(object):
+    """``P A = L U`` factorization with pivoting.
+
+    The factorization is computed once in ``O(n^3)`` and then every
+    right-hand side is solved in ``O(n^2)``.
+
+    Parameters
+    ----------
+    system : LinearSystem
+        A square system. Only its coefficients are factorized, the
+        constant terms are ignored.
+    pivoting : {"partial", "scaled", "first_nonzero"}, optional
+        Pivot selection, see ``select_pivot``.
+    """
+
+    SYSTEM_MUST_BE_SQUARE_MSG = (
+        "The number of equations and variables must be the same"
+    )
+    SINGULAR_MATRIX_MSG = "The coefficient matrix is singular"
+    CONSTANTS_MUST_MATCH_EQUATIONS_MSG = (
+        "There must be one constant term per equation"
+    )
+
+    def __init__(self, system, pivoting=PARTIAL):
+        n = len(system)
+        if n != system.dimension:
+            raise Exception(self.SYSTEM_MUST_BE_SQUARE_MSG)
+        self.backend = system.backend
+        self.dimension = n
+        self.pivoting = check_pivoting(pivoting)
+        self._coefficients = [row[:-1] for row in system._rows]
+        with self.backend.local_context():
+            self._factorize([row[:] for row in self._coefficients])
+
+    def _factorize(self, lu):
+        n = self.dimension
+        permutation = list(range(n))
+        scales = row_scales(lu, n) if self.pivoting == SCALED else None
+        for k in range(n):
+            p = select_pivot(lu, k, k, self.pivoting, scales)
+            if is_near_zero(lu[p][k]):
+                raise Exception(self.SINGULAR_MATRIX_MSG)
+            if p != k:
+                lu[k], lu[p] = lu[p], lu[k]
+                permutation[k], permutation[p] = permutation[p], permutation[k]
+                if scales is not None:
+                    scales[k], scales[p] = scales[p], scales[k]
+            pivot_row = lu[k]
+            pivot = pivot_row[k]
+            for i in range(k + 1, n):
+                row = lu[i]
+                m = row[k] / pivot
+                row[k] = m
+                if m:
+                    row[k + 1 :] = [
+                        a - m * b
+                        for a, b in zip(row[k + 1 :], pivot_row[k + 1 :])
+                    ]
+        self._lu = lu
+        self.permutation = permutation
+
+    def _substitute(self, constants):
+        n = self.dimension
+        lu = self._lu
+        # forward substitution with the unit lower triangle
+        y = [constants[i] for i in self.permutation]
+        for i in range(n):
+            row = lu[i]
+            y[i] -= sum([row[j] * y[j] for j in range(i)])
+        # back substitution with the upper triangle
+        for i in reversed(range(n)):
+            row = lu[i]
+            s = sum([row[j] * y[j] for j in range(i + 1, n)])
+            y[i] = (y[i] - s) / row[i]
+        return y
+
+    def _residual(self, constants, x):
+        high = RESIDUAL_BACKEND
+        convert = self.backend.convert
+        with high.local_context():
+            x = [high.convert(v) for v in x]
+            return [
+                convert(
+                    high.convert(b)
+                    - sum([high.convert(a) * v for a, v in zip(row, x)])
+                )
+                for row, b in zip(self._coefficients, constants)
+            ]
+
+    def solve(self, constants, refine=0) -> Vector:
+        """Solve ``A x = constants``.
+
+        ``refine`` rounds of iterative refinement are applied to the
+        solution: the residual ``constants - A x`` is computed with 64
+        significant digits and the correction is solved with the same
+        factorization. Exact backends skip the refinement, their solution
+        has no rounding error to correct.
+        """
+        if isinstance(constants, Vector):
+            constants = constants.coordinates
+        if len(constants) != self.dimension:
+            raise Exception(self.CONSTANTS_MUST_MATCH_EQUATIONS_MSG)
+        convert = self.backend.convert
+        constants = [convert(b) for b in constants]
+        with self.backend.local_context():
+            x = self._substitute(constants)
+            if self.backend.exact:
+                refine = 0
+            for _ in range(refine):
+                correction = self._substitute(self._residual(constants, x))
+                x = [v + d for v, d in zip(x, correction)]
+        return Vector(x, backend=self.backend)
+
+    def solve_many(self, constants_matrix, refine=0) -> list:
+        """Solve one system per row of ``constants_matrix``."""
+        return [
+            self.solve(constants, refine) for constants in constants_matrix
+        ]
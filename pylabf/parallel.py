@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Solve many independent linear systems on a process pool.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import collections
+import concurrent.futures
+import itertools
+import os
+
+from .backend import (
+    BACKENDS,
+    DecimalBackend,
+    FractionBackend,
+    get_backend,
+    use_backend,
+)
+from .linsys import LinearSystem
+from .lu import FIRST_NONZERO
+
+__all__ = ["DEFAULT_SYSTEMS_PER_TASK", "SolveResult", "solve_many"]
+
+DEFAULT_SYSTEMS_PER_TASK = 64
+
+SolveResult = collections.namedtuple(
+    "SolveResult", ["index", "solution", "error"]
+)
+SolveResult.__doc__ = """Outcome of the ``index``-th system.
+
+``solution`` is a ``Vector`` or a ``Parametrization``, or ``None`` when
+the system could not be solved; ``error`` then holds the message.
+"""
+
+_BACKEND_TYPES = {"decimal": DecimalBackend, "fraction": FractionBackend}
+
+# backends already built in the current worker process, by spec
+_worker_backends = {}
+
+
+def _backend_spec(backend):
+    return backend.name, getattr(backend, "precision", None)
+
+
+def _backend_from_spec(name, precision):
+    backend = get_backend(name)
+    if precision is None or precision == backend.precision:
+        return backend
+    return _BACKEND_TYPES[name](precision)
+
+
+def _system_backend(system, backend):
+    if backend is not None:
+        return backend
+    if isinstance(system, LinearSystem):
+        return system.backend
+    if system:
+        return system[0].backend
+    return get_backend()
+
+
+def _plain_rows(system, backend):
+    """Augmented rows as floats or exact strings, cheap to pickle."""
+    if isinstance(system, LinearSystem):
+        rows = system._rows
+    else:
+        rows = [
+            list(e.normal_vector.coordinates) + [e.constant_term]
+            for e in system
+        ]
+    convert = backend.convert
+    if backend is BACKENDS["float"]:
+        return [tuple([convert(v) for v in row]) for row in rows]
+    return [tuple([str(convert(v)) for v in row]) for row in rows]
+
+
+def _worker_backend(spec):
+    try:
+        return _worker_backends[spec]
+    except KeyError:
+        return _worker_backends.setdefault(spec, _backend_from_spec(*spec))
+
+
+def _solve_chunk(chunk, parametrize, pivoting):
+    results = []
+    for index, spec, rows in chunk:
+        backend = _worker_backend(spec)
+        with use_backend(backend):
+            try:
+                system = LinearSystem.from_rows(rows, backend)
+                solution = system.solve(parametrize, pivoting)
+                results.append(SolveResult(index, solution, None))
+            except Exception as e:
+                results.append(SolveResult(index, None, str(e)))
+    return results
+
+
+def solve_many(
+    systems,
+    workers=None,
+    ordered=True,
+    backend=None,
+    parametrize=True,
+    pivoting=FIRST_NONZERO,
+    chunk_size=DEFAULT_SYSTEMS_PER_TASK,
+):
+    """Solve independent systems in parallel, yielding ``SolveResult``.
+
+    The systems are sent to the workers as plain rows of floats or exact
+    strings, ``chunk_size`` systems per task, and only a few tasks per
+    worker are in flight, so ``systems`` can be a long generator.
+
+    Parameters
+    ----------
+    systems : iterable
+        Each item is a ``LinearSystem`` or a sequence of equations.
+    workers : int, optional
+        Number of processes, ``os.cpu_count()`` by default.
+    ordered : bool, optional
+        Yield the results in the order of ``systems`` (default) or as
+        soon as they are ready.
+    backend : str or Backend, optional
+        Backend of every system inside the workers. By default each
+        system keeps its own backend (the one of its first equation for
+        a sequence of equations), with the same precision.
+    parametrize, pivoting
+        As in ``LinearSystem.solve``.
+    """
+    if backend is not None:
+        backend = get_backend(backend)
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(systems, backend, chunk_size)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers
+    ) as executor:
+
+        def submit(chunk):
+            return executor.submit(_solve_chunk, chunk, parametrize, pivoting)
+
+        pending = collections.deque(
+            [submit(c) for c in itertools.islice(chunks, 2 * workers)]
+        )
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append(submit(chunk))
+                yield from future.result()
+
+
+def _payload(index, system, backend):
+    if not isinstance(system, LinearSystem):
+        system = list(system)
+    backend = _system_backend(system, backend)
+    return index, _backend_spec(backend), _plain_rows(system, backend)
+
+
+def _chunks(systems, backend, chunk_size):
+    indexed = (
+        _payload(i, system, backend) for i, system in enumerate(systems)
+    )
+    while True:
+        chunk = list(itertools.islice(indexed, chunk_size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Streaming projections of many vectors against a fixed basis.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+from .backend import DEFAULT_TOLERANCE
+from .vecarray import (
+    DEFAULT_CHUNK_SIZE,
+    VectorArray,
+    VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+    _as_operand,
+    iter_batches,
+)
+from .vector import (
+    NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG,
+    NO_UNIQUE_PARALLEL_COMPONENT_MSG,
+)
+
+__all__ = [
+    "UNKNOWN_STRATEGY_MSG",
+    "EMPTY_BASIS_MSG",
+    "Projector",
+    "OrthonormalBasisBuilder",
+]
+
+UNKNOWN_STRATEGY_MSG = "Unknown orthonormalization strategy: {}"
+EMPTY_BASIS_MSG = "No vectors were added to the basis"
+
+
+class Projector(object):
+    """Project streams of vectors onto the span of a fixed basis.
+
+    The basis is factorized once into an orthonormal set of rows, so
+    each projected chunk costs two matrix products regardless of how
+    many vectors go through the projector.
+
+    Parameters
+    ----------
+    basis : Vector, VectorArray or iterable of vectors
+        The basis vector, or the vectors spanning the subspace.
+    chunk_size : int, optional
+        Number of vectors projected per chunk.
+    """
+
+    def __init__(self, basis, chunk_size=DEFAULT_CHUNK_SIZE):
+        basis = np.atleast_2d(_as_operand(basis))
+        _, singular_values, vt = np.linalg.svd(basis, full_matrices=False)
+        self.rank = int(np.count_nonzero(singular_values > DEFAULT_TOLERANCE))
+        self.dimension = basis.shape[1]
+        self.chunk_size = chunk_size
+        self._orthonormal = vt[: self.rank]
+
+    def _project(self, chunk):
+        if chunk.shape[1] != self.dimension:
+            raise ValueError(VECTORS_MUST_HAVE_SAME_DIMENSION_MSG)
+        q = self._orthonormal
+        return (chunk @ q.T) @ q
+
+    def _iter_components(self, vectors):
+        for chunk in iter_batches(vectors, self.chunk_size):
+            parallel = self._project(chunk)
+            yield VectorArray(parallel), VectorArray(chunk - parallel)
+
+    def parallel_components(self, vectors):
+        """Yield the parallel components of ``vectors`` chunk by chunk."""
+        if not self.rank:
+            raise Exception(NO_UNIQUE_PARALLEL_COMPONENT_MSG)
+        return (par for par, _ in self._iter_components(vectors))
+
+    def orthogonal_components(self, vectors):
+        """Yield the orthogonal components of ``vectors`` chunk by chunk."""
+        if not self.rank:
+            raise Exception(NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG)
+        return (orth for _, orth in self._iter_components(vectors))
+
+    def components(self, vectors):
+        """Yield ``(parallel, orthogonal)`` chunk pairs of ``vectors``."""
+        if not self.rank:
+            raise Exception(NO_UNIQUE_PARALLEL_COMPONENT_MSG)
+        return self._iter_components(vectors)
+
+
+class OrthonormalBasisBuilder(object):
+    """Incrementally build an orthonormal basis of the span of vectors.
+
+    Vectors whose residual, after removing their components along the
+    current basis, is near zero relative to their own magnitude are
+    dependent and are dropped.
+
+    Parameters
+    ----------
+    strategy : {"mgs", "householder"}, optional
+        ``"mgs"`` runs modified Gram-Schmidt. ``"householder"`` factorizes
+        each batch with a Householder QR.
+    tolerance : float, optional
+        Relative ``is_near_zero`` tolerance of the residuals.
+    chunk_size : int, optional
+        Number of vectors orthonormalized per batch by ``extend``.
+    """
+
+    STRATEGIES = ("mgs", "householder")
+
+    def __init__(
+        self, strategy="mgs", tolerance=None, chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(UNKNOWN_STRATEGY_MSG.format(strategy))
+        self.strategy = strategy
+        self.tolerance = DEFAULT_TOLERANCE if tolerance is None else tolerance
+        self.chunk_size = chunk_size
+        self.dimension = None
+        self._basis = None
+
+    @property
+    def rank(self):
+        return 0 if self._basis is None else len(self._basis)
+
+    @property
+    def basis(self):
+        """The orthonormal basis as a ``VectorArray``, one vector per row."""
+        if self._basis is None:
+            raise Exception(EMPTY_BASIS_MSG)
+        return VectorArray(self._basis)
+
+    def to_vectors(self, backend=None):
+        """The orthonormal basis as a list of ``Vector``."""
+        return self.basis.to_vectors(backend=backend)
+
+    def add(self, vector) -> bool:
+        """Add one vector. Return whether it extended the basis."""
+        return bool(self.extend([vector]))
+
+    def extend(self, vectors) -> int:
+        """Add many vectors. Return how many of them extended the basis."""
+        rank = self.rank
+        for chunk in iter_batches(vectors, self.chunk_size):
+            self._extend_chunk(np.array(chunk, dtype=np.float64))
+        return self.rank - rank
+
+    def _extend_chunk(self, chunk):
+        if self.dimension is None:
+            self.dimension = chunk.shape[1]
+            self._basis = np.empty((0, self.dimension))
+        if chunk.shape[1] != self.dimension:
+            raise ValueError(VECTORS_MUST_HAVE_SAME_DIMENSION_MSG)
+        thresholds = self.tolerance * np.linalg.norm(chunk, axis=1)
+        if self.strategy == "mgs":
+            self._basis = self._modified_gram_schmidt(chunk, thresholds)
+        else:
+            self._basis = self._householder(chunk, thresholds)
+
+    def _modified_gram_schmidt(self, chunk, thresholds):
+        for q in self._basis:
+            chunk -= np.outer(chunk @ q, q)
+        new = [self._basis]
+        for i, x in enumerate(chunk):
+            residual = np.linalg.norm(x)
+            if residual <= thresholds[i] or not residual:
+                continue
+            q = x / residual
+            rest = chunk[i + 1 :]
+            rest -= np.outer(rest @ q, q)
+            new.append(q[np.newaxis, :])
+        return np.vstack(new)
+
+    def _householder(self, chunk, thresholds):
+        basis = self._basis
+        while len(chunk) and len(basis) < self.dimension:
+            for _ in range(2):
+                chunk = chunk - (chunk @ basis.T) @ basis
+            # drop at once every vector already in the span of the basis
+            residuals = np.linalg.norm(chunk, axis=1)
+            independent = (residuals > thresholds) & (residuals > 0)
+            chunk, thresholds = chunk[independent], thresholds[independent]
+            if not len(chunk):
+                break
+            size = self.dimension - len(basis)
+            q, r = np.linalg.qr(chunk[:size].T)
+            diagonal = np.abs(np.diag(r))
+            dependent = (diagonal <= thresholds[:size]) | (diagonal == 0)
+            # the columns after the first dependent one are reduced again
+            # against the grown basis in the next pass
+            accepted = int(np.argmax(dependent)) if dependent.any() else size
+            accepted = max(accepted, 1)
+            basis = np.vstack([basis, q[:, :accepted].T])
+            chunk = chunk[accepted:]
+            thresholds = thresholds[accepted:]
+        return basis
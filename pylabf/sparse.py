@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Sparse linear systems stored as dictionaries of rows.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import heapq
+import math
+
+from .backend import get_backend, is_near_zero
+from .linsys import LinearSystem, Parametrization
+from .vector import Vector
+
+__all__ = [
+    "NATURAL",
+    "MINIMUM_DEGREE",
+    "ORDERINGS",
+    "UNKNOWN_ORDERING_MSG",
+    "COLUMN_OUT_OF_RANGE_MSG",
+    "ROWS_AND_CONSTANTS_LENGTH_MSG",
+    "PIVOT_THRESHOLD",
+    "minimum_degree_ordering",
+    "SparseLinearSystem",
+]
+
+NATURAL = "natural"
+MINIMUM_DEGREE = "minimum_degree"
+ORDERINGS = (NATURAL, MINIMUM_DEGREE)
+
+UNKNOWN_ORDERING_MSG = "Unknown column ordering: {}"
+COLUMN_OUT_OF_RANGE_MSG = "Column {} is out of range"
+ROWS_AND_CONSTANTS_LENGTH_MSG = "There must be one constant term per row"
+
+# A candidate pivot must be at least this fraction of the largest entry of
+# its column, the rest of the choice is left to sparsity. It is a string so
+# the Decimal and Fraction backends convert it exactly.
+PIVOT_THRESHOLD = "0.1"
+
+
+def _dense_row_limit(dimension):
+    return max(16, int(10 * math.sqrt(dimension)))
+
+
+def minimum_degree_ordering(rows, dimension) -> list:
+    """Fill-reducing column ordering for the elimination of ``rows``.
+
+    Minimum degree on the graph of ``A^T A``, where two columns are
+    adjacent when they share a row. Dense rows are left out of the graph
+    so they don't turn it into a clique.
+
+    Parameters
+    ----------
+    rows : iterable of dict
+        Nonzero coefficients of each row, ``{column: value}``.
+    dimension : int
+        Number of columns.
+    """
+    limit = _dense_row_limit(dimension)
+    adjacency = [set() for _ in range(dimension)]
+    for row in rows:
+        if len(row) > limit:
+            continue
+        for c in row:
+            adjacency[c].update(row)
+    for c, neighbors in enumerate(adjacency):
+        neighbors.discard(c)
+
+    heap = [(len(neighbors), c) for c, neighbors in enumerate(adjacency)]
+    heapq.heapify(heap)
+    eliminated = [False] * dimension
+    order = []
+    while heap:
+        degree, c = heapq.heappop(heap)
+        if eliminated[c] or degree != len(adjacency[c]):
+            continue
+        eliminated[c] = True
+        order.append(c)
+        neighbors = adjacency[c]
+        for u in neighbors:
+            adjacency[u].discard(c)
+            adjacency[u].update(neighbors)
+            adjacency[u].discard(u)
+            heapq.heappush(heap, (len(adjacency[u]), u))
+        adjacency[c] = set()
+    return order
+
+
+class SparseLinearSystem(object):
+    """Linear system that only stores its nonzero coefficients.
+
+    Parameters
+    ----------
+    rows : iterable of dict
+        Coefficients of each equation as ``{column: value}``. Missing
+        columns are zero.
+    constants : iterable
+        Constant term of each equation.
+    dimension : int
+        Number of variables.
+    backend : str or Backend, optional
+    """
+
+    def __init__(self, rows, constants, dimension, backend=None):
+        self.backend = get_backend(backend)
+        self.dimension = dimension
+        convert = self.backend.convert
+        self._rows = []
+        for row in rows:
+            row = {c: convert(v) for c, v in dict(row).items()}
+            for c in row:
+                if not 0 <= c < dimension:
+                    raise ValueError(COLUMN_OUT_OF_RANGE_MSG.format(c))
+            self._rows.append({c: v for c, v in row.items() if v})
+        self._constants = [convert(k) for k in constants]
+        if len(self._constants) != len(self._rows):
+            raise ValueError(ROWS_AND_CONSTANTS_LENGTH_MSG)
+        self.pivot_columns = None
+
+    @classmethod
+    def from_linear_system(cls, system):
+        rows = [
+            {j: v for j, v in enumerate(row[:-1]) if v} for row in system._rows
+        ]
+        constants = [row[-1] for row in system._rows]
+        return cls(rows, constants, system.dimension, backend=system.backend)
+
+    def to_linear_system(self) -> LinearSystem:
+        """Dense ``LinearSystem`` with the same equations."""
+        zero = self.backend.convert(0)
+        rows = []
+        for row, k in zip(self._rows, self._constants):
+            dense = [zero] * (self.dimension + 1)
+            for c, v in row.items():
+                dense[c] = v
+            dense[-1] = k
+            rows.append(dense)
+        return LinearSystem.from_rows(rows, backend=self.backend)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        return dict(self._rows[i]), self._constants[i]
+
+    @property
+    def nnz(self):
+        """Number of stored coefficients."""
+        return sum([len(row) for row in self._rows])
+
+    def copy(self):
+        system = object.__new__(type(self))
+        system.backend = self.backend
+        system.dimension = self.dimension
+        system._rows = [dict(row) for row in self._rows]
+        system._constants = list(self._constants)
+        system.pivot_columns = self.pivot_columns
+        return system
+
+    def swap_rows(self, row1, row2):
+        rows, constants = self._rows, self._constants
+        rows[row1], rows[row2] = rows[row2], rows[row1]
+        constants[row1], constants[row2] = constants[row2], constants[row1]
+
+    def multiply_coefficient_and_row(self, coefficient, row):
+        coefficient = self.backend.convert(coefficient)
+        target = self._rows[row]
+        for c in target:
+            target[c] *= coefficient
+        self._constants[row] *= coefficient
+
+    def add_multiple_times_row_to_row(
+        self, coefficient, row_to_add, row_to_be_added_to
+    ):
+        """Add ``coefficient`` times a row to another one.
+
+        Only the nonzeros of the added row are visited. Entries that
+        become negligible are dropped. Returns the columns that appeared
+        and disappeared in the target row.
+        """
+        coefficient = self.backend.convert(coefficient)
+        source = self._rows[row_to_add]
+        target = self._rows[row_to_be_added_to]
+        filled, dropped = [], []
+        for c, v in source.items():
+            if c in target:
+                value = target[c] + coefficient * v
+                if is_near_zero(value):
+                    del target[c]
+                    dropped.append(c)
+                else:
+                    target[c] = value
+            else:
+                target[c] = coefficient * v
+                filled.append(c)
+        self._constants[row_to_be_added_to] += (
+            coefficient * self._constants[row_to_add]
+        )
+        return filled, dropped
+
+    def column_ordering(self, ordering=MINIMUM_DEGREE) -> list:
+        if ordering == NATURAL:
+            return list(range(self.dimension))
+        if ordering == MINIMUM_DEGREE:
+            return minimum_degree_ordering(self._rows, self.dimension)
+        raise ValueError(UNKNOWN_ORDERING_MSG.format(ordering))
+
+    def compute_triangular_form(self, ordering=MINIMUM_DEGREE):
+        """Eliminate the columns in a fill-reducing order.
+
+        Each column is pivoted on the sparsest row whose coefficient is
+        not much smaller than the largest one of the column (threshold
+        partial pivoting). The result has the pivot rows first; row
+        ``i`` has its pivot in column ``pivot_columns[i]`` and none of
+        the pivot columns of the previous rows. The remaining rows have
+        no coefficients.
+        """
+        order = self.column_ordering(ordering)
+        system = self.copy()
+        rows = system._rows
+        column_rows = [set() for _ in range(system.dimension)]
+        for r, row in enumerate(rows):
+            for c in row:
+                column_rows[c].add(r)
+
+        pivots = []
+        threshold = system.backend.convert(PIVOT_THRESHOLD)
+        with system.backend.local_context():
+            for c in order:
+                candidates = column_rows[c]
+                if not candidates:
+                    continue
+                largest = max([abs(rows[r][c]) for r in candidates])
+                if is_near_zero(largest):
+                    continue
+                p = min(
+                    [
+                        r
+                        for r in candidates
+                        if abs(rows[r][c]) >= threshold * largest
+                    ],
+                    key=lambda r: (len(rows[r]), r),
+                )
+                for j in rows[p]:
+                    column_rows[j].discard(p)
+                beta = rows[p][c]
+                for r in list(candidates):
+                    filled, dropped = system.add_multiple_times_row_to_row(
+                        -rows[r][c] / beta, p, r
+                    )
+                    # drop the rounding residue of the eliminated entry
+                    if c in rows[r]:
+                        del rows[r][c]
+                        dropped.append(c)
+                    for j in filled:
+                        column_rows[j].add(r)
+                    for j in dropped:
+                        column_rows[j].discard(r)
+                pivots.append((p, c))
+
+        pivot_rows = [p for p, _ in pivots]
+        rest = sorted(set(range(len(rows))) - set(pivot_rows))
+        system._rows = [rows[r] for r in pivot_rows + rest]
+        system._constants = [system._constants[r] for r in pivot_rows + rest]
+        system.pivot_columns = [c for _, c in pivots]
+        return system
+
+    def _back_substitute(self, constants, values):
+        x = dict(values)
+        pivot_columns = self.pivot_columns
+        for i in reversed(range(len(pivot_columns))):
+            c = pivot_columns[i]
+            row = self._rows[i]
+            s = sum([v * x[j] for j, v in row.items() if j != c and x[j]])
+            x[c] = (constants[i] - s) / row[c]
+        return [x[j] for j in range(self.dimension)]
+
+    def solve(self, parametrize=True, ordering=MINIMUM_DEGREE):
+        """Solve the system, with the same results as
+        ``LinearSystem.solve``.
+        """
+        tf = self.compute_triangular_form(ordering)
+        rank = len(tf.pivot_columns)
+        for k in tf._constants[rank:]:
+            if not is_near_zero(k):
+                raise Exception(LinearSystem.NO_SOLUTIONS_MSG)
+
+        zero = self.backend.convert(0)
+        one = self.backend.convert(1)
+        pivots = set(tf.pivot_columns)
+        free = [c for c in range(self.dimension) if c not in pivots]
+        with self.backend.local_context():
+            basepoint = tf._back_substitute(
+                tf._constants, {c: zero for c in free}
+            )
+            if not free:
+                return Vector(basepoint, backend=self.backend)
+            if not parametrize:
+                raise Exception(LinearSystem.INF_SOLUTIONS_MSG)
+            homogeneous = [zero] * rank
+            direction_vectors = []
+            for f in free:
+                values = {c: zero for c in free}
+                values[f] = one
+                direction_vectors.append(
+                    Vector(
+                        tf._back_substitute(homogeneous, values),
+                        backend=self.backend,
+                    )
+                )
+        return Parametrization(
+            Vector(basepoint, backend=self.backend), direction_vectors
+        )
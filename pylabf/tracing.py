@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Opt-in instrumentation of the row operations of a LinearSystem.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import contextlib
+import time
+from collections import Counter, defaultdict, namedtuple
+
+__all__ = [
+    "SWAP",
+    "SCALE",
+    "ADD_MULTIPLE",
+    "RowOperation",
+    "Phase",
+    "EliminationStats",
+    "trace_phase",
+]
+
+SWAP = "swap"
+SCALE = "scale"
+ADD_MULTIPLE = "add_multiple"
+
+RowOperation = namedtuple("RowOperation", ["kind", "rows", "coefficient"])
+Phase = namedtuple("Phase", ["name", "elapsed"])
+
+
+class EliminationStats(object):
+    """Observer counting row operations and timing elimination phases.
+
+    Attach it with ``LinearSystem(planes, observer=EliminationStats())``
+    or by setting ``system.observer``.
+    """
+
+    def __init__(self):
+        self.operations = Counter()
+        self.phase_times = defaultdict(float)
+        self.phase_calls = Counter()
+
+    def __call__(self, event):
+        if isinstance(event, RowOperation):
+            self.operations[event.kind] += 1
+        elif isinstance(event, Phase):
+            self.phase_times[event.name] += event.elapsed
+            self.phase_calls[event.name] += 1
+
+    @property
+    def total_operations(self):
+        return sum(self.operations.values())
+
+    def reset(self):
+        self.operations.clear()
+        self.phase_times.clear()
+        self.phase_calls.clear()
+
+
+@contextlib.contextmanager
+def _timed_phase(observer, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observer(Phase(name, time.perf_counter() - start))
+
+
+def trace_phase(observer, name):
+    """Time the ``with`` block as phase ``name`` if there is an observer."""
+    if observer is None:
+        return contextlib.nullcontext()
+    return _timed_phase(observer, name)
@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+"""PyLABF
+
+Batched versions of the basic vector operations backed by NumPy.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import itertools
+
+import numpy as np
+
+from .backend import DEFAULT_TOLERANCE
+from .vector import (
+    CROSS_PRODUCT_OPERATION_ONLY_FOR_3D_VECTORS_MSG,
+    RESULT_WAS_NOT_ORTOGONAL_AFTER_OPERATION_MSG,
+    VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+    Vector,
+)
+
+__all__ = [
+    "VECTOR_ARRAY_MUST_BE_TWO_DIMENSIONAL_MSG",
+    "COLLECTIONS_MUST_HAVE_SAME_LENGTH_MSG",
+    "DEFAULT_BLOCK_SIZE",
+    "DEFAULT_CHUNK_SIZE",
+    "VectorArray",
+    "iter_batches",
+    "batch_plus",
+    "batch_minus",
+    "batch_times_scalar",
+    "batch_dot_product",
+    "iter_angles_between_vectors",
+    "batch_angle_between_vectors",
+    "batch_cross_product",
+    "batch_area_of_parallelogram_spanned",
+    "batch_area_of_triangle_spanned",
+    "parallel_matrix",
+    "orthogonal_matrix",
+    "parallel_pairs",
+    "orthogonal_pairs",
+]
+
+VECTOR_ARRAY_MUST_BE_TWO_DIMENSIONAL_MSG = (
+    "The vectors must be stacked in a two dimensional buffer"
+)
+COLLECTIONS_MUST_HAVE_SAME_LENGTH_MSG = (
+    "Both collections must have the same number of vectors"
+)
+
+DEFAULT_BLOCK_SIZE = 256
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class VectorArray(object):
+    """N vectors of the same dimension stored in one contiguous buffer.
+
+    Parameters
+    ----------
+    vectors : VectorArray, numpy.ndarray or iterable
+        The vectors to stack. Each item can be a ``Vector`` or any
+        sequence of numbers.
+    """
+
+    def __init__(self, vectors):
+        if isinstance(vectors, VectorArray):
+            data = vectors.data
+        elif isinstance(vectors, np.ndarray):
+            data = vectors
+        else:
+            data = [
+                v.coordinates if isinstance(v, Vector) else tuple(v)
+                for v in vectors
+            ]
+        self.data = np.ascontiguousarray(data, dtype=np.float64)
+        if self.data.ndim != 2 or not self.data.shape[1]:
+            raise ValueError(VECTOR_ARRAY_MUST_BE_TWO_DIMENSIONAL_MSG)
+
+    @property
+    def dimension(self):
+        return self.data.shape[1]
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return type(self)(self.data[i])
+        return Vector(self.data[i].tolist())
+
+    def __iter__(self):
+        for row in self.data.tolist():
+            yield Vector(row)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.data
+        return self.data.astype(dtype)
+
+    def __str__(self):
+        return "VectorArray: {}".format(self.data)
+
+    def __repr__(self):
+        return "VectorArray({!r})".format(self.data)
+
+    def __eq__(self, other):
+        return np.array_equal(self.data, _as_operand(other))
+
+    def __add__(self, other):
+        return batch_plus(self, other)
+
+    def __sub__(self, other):
+        return batch_minus(self, other)
+
+    def to_vectors(self, backend=None):
+        """Convert every row back to a ``Vector``."""
+        return [Vector(row, backend=backend) for row in self.data.tolist()]
+
+
+def _as_operand(obj):
+    if isinstance(obj, VectorArray):
+        return obj.data
+    if isinstance(obj, Vector):
+        return np.array(obj.coordinates, dtype=np.float64)
+    try:
+        return np.asarray(obj, dtype=np.float64)
+    except (TypeError, ValueError):
+        return VectorArray(obj).data
+
+
+def _operands(vectors1, vectors2):
+    a = _as_operand(vectors1)
+    b = _as_operand(vectors2)
+    if a.shape[-1] != b.shape[-1]:
+        raise ValueError(VECTORS_MUST_HAVE_SAME_DIMENSION_MSG)
+    return a, b
+
+
+def iter_batches(vectors, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield ``vectors`` as 2-D float64 arrays of at most ``chunk_size``
+    rows.
+
+    ``VectorArray`` and array inputs are sliced without copying. Any
+    other iterable (lists, generators...) is consumed lazily, one chunk
+    at a time.
+    """
+    if isinstance(vectors, (VectorArray, np.ndarray)):
+        data = np.atleast_2d(_as_operand(vectors))
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+        return
+    iterator = iter(vectors)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield VectorArray(chunk).data
+
+
+def batch_plus(vectors1, vectors2) -> VectorArray:
+    """Add two collections of vectors, or a collection and a ``Vector``."""
+    a, b = _operands(vectors1, vectors2)
+    return VectorArray(np.atleast_2d(a + b))
+
+
+def batch_minus(vectors1, vectors2) -> VectorArray:
+    """Subtract two collections of vectors, or a ``Vector`` from them."""
+    a, b = _operands(vectors1, vectors2)
+    return VectorArray(np.atleast_2d(a - b))
+
+
+def batch_times_scalar(vectors, c) -> VectorArray:
+    """Multiply each vector by ``c``, a scalar or one scalar per vector."""
+    a = _as_operand(vectors)
+    c = np.asarray(c, dtype=np.float64)
+    if c.ndim:
+        c = c[:, np.newaxis]
+    return VectorArray(np.atleast_2d(a * c))
+
+
+def batch_dot_product(vectors1, vectors2) -> np.ndarray:
+    """Row by row dot product of two collections of vectors."""
+    a, b = _operands(vectors1, vectors2)
+    return np.einsum("...i,...i->...", a, b)
+
+
+def iter_angles_between_vectors(
+    vectors1, vectors2, sexagesimal=False, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """Yield the angles between two aligned collections chunk by chunk.
+
+    ``vectors2`` can also be a single ``Vector``, used as reference for
+    every vector of ``vectors1``. The cosines are clamped to ``[-1, 1]``
+    and the angles of zero vectors are ``nan``.
+    """
+    if isinstance(vectors2, Vector):
+        reference = _as_operand(vectors2)
+        pairs = (
+            (chunk, reference) for chunk in iter_batches(vectors1, chunk_size)
+        )
+    else:
+        pairs = itertools.zip_longest(
+            iter_batches(vectors1, chunk_size),
+            iter_batches(vectors2, chunk_size),
+        )
+    for a, b in pairs:
+        if a is None or b is None or (b.ndim == 2 and len(a) != len(b)):
+            raise ValueError(COLLECTIONS_MUST_HAVE_SAME_LENGTH_MSG)
+        if a.shape[-1] != b.shape[-1]:
+            raise ValueError(VECTORS_MUST_HAVE_SAME_DIMENSION_MSG)
+        norms = np.linalg.norm(a, axis=-1) * np.linalg.norm(b, axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosines = batch_dot_product(a, b) / norms
+        angles = np.arccos(np.clip(cosines, -1.0, 1.0))
+        yield np.degrees(angles) if sexagesimal else angles
+
+
+def batch_angle_between_vectors(
+    vectors1, vectors2, sexagesimal=False, chunk_size=DEFAULT_CHUNK_SIZE
+) -> np.ndarray:
+    """Angles between two aligned collections, or against one ``Vector``."""
+    chunks = list(
+        iter_angles_between_vectors(
+            vectors1, vectors2, sexagesimal, chunk_size
+        )
+    )
+    if not chunks:
+        return np.empty(0)
+    return np.concatenate(chunks)
+
+
+def batch_cross_product(vectors1, vectors2, verify=False) -> VectorArray:
+    """Row by row cross product of two collections of 3D vectors.
+
+    With ``verify=True`` every normal is checked to be orthogonal to
+    both of its factors, which is only meant for debugging.
+    """
+    a, b = _operands(vectors1, vectors2)
+    if a.shape[-1] != 3:
+        raise Exception(CROSS_PRODUCT_OPERATION_ONLY_FOR_3D_VECTORS_MSG)
+    normals = np.atleast_2d(np.cross(a, b))
+    if verify:
+        # relative to |a| |n|, the products of large vectors have large
+        # rounding errors
+        scale = np.linalg.norm(normals, axis=-1)
+        for factor in (a, b):
+            bound = DEFAULT_TOLERANCE * np.linalg.norm(factor, axis=-1) * scale
+            if not np.all(np.abs(batch_dot_product(factor, normals)) <= bound):
+                raise Exception(RESULT_WAS_NOT_ORTOGONAL_AFTER_OPERATION_MSG)
+    return VectorArray(normals)
+
+
+def batch_area_of_parallelogram_spanned(vectors1, vectors2) -> np.ndarray:
+    """Areas of the parallelograms spanned by pairs of 3D vectors."""
+    normals = batch_cross_product(vectors1, vectors2).data
+    return np.sqrt(np.einsum("ij,ij->i", normals, normals))
+
+
+def batch_area_of_triangle_spanned(vectors1, vectors2) -> np.ndarray:
+    """Areas of the triangles spanned by pairs of 3D vectors."""
+    return batch_area_of_parallelogram_spanned(vectors1, vectors2) / 2
+
+
+def _rounded_unit_rows(a, tolerance):
+    # the rows of parallel_direction_key: unit vectors rounded and sign
+    # fixed so that the first nonzero coordinate is positive
+    squares = np.einsum("ij,ij->i", a, a)
+    zero = squares < tolerance
+    norms = np.sqrt(np.where(zero, 1.0, squares))
+    units = np.round(a / norms[:, np.newaxis], 10)
+    first = np.argmax(units != 0, axis=1)
+    signs = np.sign(units[np.arange(len(units)), first])
+    units *= np.where(signs < 0, -1.0, 1.0)[:, np.newaxis]
+    return units, zero
+
+
+def _parallel_block(units, zero, start, stop, first_column):
+    block = units[start:stop, np.newaxis, :]
+    others = units[np.newaxis, first_column:, :]
+    result = np.all(block == others, axis=2)
+    result |= zero[start:stop, np.newaxis]
+    result |= zero[np.newaxis, first_column:]
+    return result
+
+
+def _orthogonal_block(a, tolerance, start, stop, first_column):
+    return np.abs(a[start:stop] @ a[first_column:].T) < tolerance
+
+
+def _pairwise_blocks(a, kind, tolerance, block_size, upper):
+    _tolerance = 1e-10 if tolerance is None else tolerance
+    if kind == "parallel":
+        units, zero = _rounded_unit_rows(a, _tolerance)
+    for start in range(0, len(a), block_size):
+        stop = min(start + block_size, len(a))
+        first_column = start if upper else 0
+        if kind == "parallel":
+            block = _parallel_block(units, zero, start, stop, first_column)
+        else:
+            block = _orthogonal_block(a, _tolerance, start, stop, first_column)
+        yield start, first_column, block
+
+
+def _pairwise_matrix(vectors, kind, tolerance, block_size):
+    a = _as_operand(vectors)
+    result = np.empty((len(a), len(a)), dtype=bool)
+    for start, _, block in _pairwise_blocks(
+        a, kind, tolerance, block_size, upper=False
+    ):
+        result[start : start + len(block)] = block
+    return result
+
+
+def _pairwise_pairs(vectors, kind, tolerance, block_size):
+    pairs = []
+    a = _as_operand(vectors)
+    for start, first_column, block in _pairwise_blocks(
+        a, kind, tolerance, block_size, upper=True
+    ):
+        rows, columns = np.nonzero(block)
+        rows += start
+        columns += first_column
+        keep = rows < columns
+        pairs.extend(zip(rows[keep].tolist(), columns[keep].tolist()))
+    return pairs
+
+
+def parallel_matrix(
+    vectors, tolerance=None, block_size=DEFAULT_BLOCK_SIZE
+) -> np.ndarray:
+    """All-pairs ``is_parallel`` as an N x N boolean matrix.
+
+    The pairs are evaluated ``block_size`` rows at a time, so the
+    temporary memory is bounded by ``block_size * N * dimension``.
+    """
+    return _pairwise_matrix(vectors, "parallel", tolerance, block_size)
+
+
+def orthogonal_matrix(
+    vectors, tolerance=None, block_size=DEFAULT_BLOCK_SIZE
+) -> np.ndarray:
+    """All-pairs ``is_orthogonal`` as an N x N boolean matrix."""
+    return _pairwise_matrix(vectors, "orthogonal", tolerance, block_size)
+
+
+def parallel_pairs(vectors, tolerance=None, block_size=DEFAULT_BLOCK_SIZE):
+    """List the index pairs ``(i, j)``, ``i < j``, of parallel vectors.
+
+    Only the upper triangle is evaluated and the full matrix is never
+    materialized.
+    """
+    return _pairwise_pairs(vectors, "parallel", tolerance, block_size)
+
+
+def orthogonal_pairs(vectors, tolerance=None, block_size=DEFAULT_BLOCK_SIZE):
+    """List the index pairs ``(i, j)``, ``i < j``, of orthogonal vectors."""
+    return _pairwise_pairs(vectors, "orthogonal", tolerance, block_size)
@@ -21,11 +21,43 @@ Functions is python for the most commun basic linear algebra operations.
 # =============================================================================
 
 import math
-from decimal import Decimal, getcontext
+from collections import namedtuple
+from decimal import Decimal
 from string import ascii_lowercase
 
-getcontext().prec = 30
-
+from .backend import DEFAULT_TOLERANCE, get_backend
+
+__all__ = [
+    "CANNOT_NORMALIZE_ZERO_VECTOR_MSG",
+    "NO_UNIQUE_PARALLEL_COMPONENT_MSG",
+    "NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG",
+    "RESULT_WAS_NOT_ORTOGONAL_AFTER_OPERATION_MSG",
+    "CROSS_PRODUCT_OPERATION_ONLY_FOR_3D_VECTORS_MSG",
+    "VECTOR_IS_IMMUTABLE_MSG",
+    "NO_ANGLE_WITH_ZERO_VECTOR_MSG",
+    "VECTORS_MUST_HAVE_SAME_DIMENSION_MSG",
+    "NO_VECTORS_TO_REDUCE_MSG",
+    "COEFFICIENTS_AND_VECTORS_LENGTH_MSG",
+    "Vector",
+    "plus",
+    "minus",
+    "times_scalar",
+    "dot_product",
+    "vector_sum",
+    "centroid",
+    "linear_combination",
+    "angle_between_vectors",
+    "is_parallel",
+    "ParallelClass",
+    "parallel_direction_key",
+    "group_parallel",
+    "is_orthogonal",
+    "get_parallel_projection",
+    "get_orthogonal_projection",
+    "cross_product",
+    "area_of_parallelogram_spanned",
+    "area_of_triangle_spanned",
+]
 
 CANNOT_NORMALIZE_ZERO_VECTOR_MSG = "Cannot normalize the zero vector"
 NO_UNIQUE_PARALLEL_COMPONENT_MSG = "No unique parallel component"
@@ -36,21 +68,60 @@ RESULT_WAS_NOT_ORTOGONAL_AFTER_OPERATION_MSG = (
 CROSS_PRODUCT_OPERATION_ONLY_FOR_3D_VECTORS_MSG = (
     "Cross product operation only for 3D vectors"
 )
+VECTOR_IS_IMMUTABLE_MSG = "Vector objects are immutable"
+NO_ANGLE_WITH_ZERO_VECTOR_MSG = "Cannot compute an angle with the zero vector"
+VECTORS_MUST_HAVE_SAME_DIMENSION_MSG = (
+    "All the vectors must have the same dimension"
+)
+NO_VECTORS_TO_REDUCE_MSG = "At least one vector is needed"
+COEFFICIENTS_AND_VECTORS_LENGTH_MSG = (
+    "There must be one coefficient per vector"
+)
 
 
 class Vector(object):
-    def __init__(self, coordinates: list):
-        try:
-            if not coordinates:
-                raise ValueError
-            self.coordinates = tuple([Decimal(x) for x in coordinates])
-            self.dimension = len(coordinates)
-
-        except ValueError:
-            raise ValueError("The coordinates must be nonempty")
 
+    __slots__ = (
+        "coordinates",
+        "dimension",
+        "backend",
+        "_magnitude",
+        "_unit_vector",
+        "_hash",
+    )
+
+    def __init__(self, coordinates: list, backend=None):
+        backend = get_backend(backend)
+        try:
+            coordinates = tuple(coordinates)
         except TypeError:
             raise TypeError("The coordinates must be an iterable")
+        if not coordinates:
+            raise ValueError("The coordinates must be nonempty")
+
+        convert = backend.convert
+        _set = object.__setattr__
+        _set(self, "backend", backend)
+        _set(self, "coordinates", tuple([convert(x) for x in coordinates]))
+        _set(self, "dimension", len(self.coordinates))
+        _set(self, "_magnitude", None)
+        _set(self, "_unit_vector", None)
+        _set(self, "_hash", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(VECTOR_IS_IMMUTABLE_MSG)
+
+    def __delattr__(self, name):
+        raise AttributeError(VECTOR_IS_IMMUTABLE_MSG)
+
+    def __reduce__(self):
+        return (type(self), (self.coordinates, self.backend))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __len__(self):
         return self.dimension
@@ -58,38 +129,38 @@ class Vector(object):
     def __str__(self):
         return "Vector: {}".format(self.coordinates)
 
-    def __eq__(self, v: "Vector") -> "Vector":
+    def __eq__(self, v: "Vector") -> bool:
+        if not isinstance(v, Vector):
+            return NotImplemented
         return self.coordinates == v.coordinates
 
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self.coordinates))
+        return self._hash
+
     def __add__(self, vect: "Vector") -> "Vector":
-        result = [
-            v1 + v2 for v1, v2 in zip(self.coordinates, vect.coordinates)
-        ]
-        return type(self)(result)
+        with self.backend.local_context():
+            result = [
+                v1 + v2 for v1, v2 in zip(self.coordinates, vect.coordinates)
+            ]
+        return type(self)(result, backend=self.backend)
 
     def __sub__(self, vect: "Vector") -> "Vector":
-        result = [
-            v1 - v2 for v1, v2 in zip(self.coordinates, vect.coordinates)
-        ]
-        return type(self)(result)
+        with self.backend.local_context():
+            result = [
+                v1 - v2 for v1, v2 in zip(self.coordinates, vect.coordinates)
+            ]
+        return type(self)(result, backend=self.backend)
 
     def __mul__(self, other: "Vector") -> "Vector":
         if isinstance(other, list):
-            vect = Vector(other)
-            return sum(
-                [v1 * v2 for v1, v2 in zip(vect.coordinates, self.coordinates)]
-            )
+            other = Vector(other, backend=self.backend)
         assert isinstance(other, type(self))
-        return sum(
-            [v1 * v2 for v1, v2 in zip(other.coordinates, self.coordinates)]
-        )
+        return dot_product(other, self)
 
     def __abs__(self) -> Decimal:
-        sum_of_squares = sum(
-            [Decimal(v) ** Decimal("2.0") for v in self.coordinates]
-        )
-        _magnitude = Decimal(math.sqrt(sum_of_squares))
-        return _magnitude
+        return self.magnitude
 
     def __repr__(self):
         try:
@@ -99,51 +170,126 @@ class Vector(object):
         except Exception as e:
             raise e
 
+    @property
+    def magnitude(self):
+        if self._magnitude is None:
+            with self.backend.local_context():
+                sum_of_squares = sum([v * v for v in self.coordinates])
+            object.__setattr__(
+                self, "_magnitude", self.backend.sqrt(sum_of_squares)
+            )
+        return self._magnitude
+
     @property
     def unit_vector(self):
-        try:
-            c = Decimal("1.0") / self.magnitude
-            return times_scalar(self, c)
-        except ZeroDivisionError:
-            raise Exception("Cannot normalize the zero vector")
+        if self._unit_vector is None:
+            try:
+                with self.backend.local_context():
+                    c = self.backend.convert(1) / self.magnitude
+            except ZeroDivisionError:
+                raise Exception(CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+            object.__setattr__(self, "_unit_vector", times_scalar(self, c))
+        return self._unit_vector
 
     # def get_ortogonal(self):
 
 
 def plus(vect1: Vector, vect2: Vector) -> Vector:
-    result = [v1 + v2 for v1, v2 in zip(vect1.coordinates, vect2.coordinates)]
-    return Vector(result)
+    return vect1 + vect2
 
 
 def minus(vect1: Vector, vect2: Vector) -> Vector:
-    result = [v1 - v2 for v1, v2 in zip(vect1.coordinates, vect2.coordinates)]
-    return Vector(result)
+    return vect1 - vect2
 
 
 # TypeError: can't multiply sequence by non-int of type 'decimal.Decimal'
 
 
 def times_scalar(vector1: Vector, c) -> Vector:
-    return Vector([c * v for v in vector1.coordinates])
+    backend = vector1.backend
+    c = backend.convert(c)
+    with backend.local_context():
+        result = [c * v for v in vector1.coordinates]
+    return Vector(result, backend=backend)
 
 
 def dot_product(vect1: Vector, vect2: Vector) -> Decimal:
-    mult = [v1 * v2 for v1, v2 in zip(vect1.coordinates, vect2.coordinates)]
-    return sum(mult)
+    with vect1.backend.local_context():
+        return sum(
+            [v1 * v2 for v1, v2 in zip(vect1.coordinates, vect2.coordinates)]
+        )
+
+
+def _accumulate(vectors, coefficients=None):
+    vectors = iter(vectors)
+    coefficients = None if coefficients is None else iter(coefficients)
+    buffer = None
+    count = 0
+    for vect in vectors:
+        if coefficients is None:
+            c = None
+        else:
+            try:
+                c = next(coefficients)
+            except StopIteration:
+                raise ValueError(COEFFICIENTS_AND_VECTORS_LENGTH_MSG)
+        coordinates = vect.coordinates
+        if buffer is None:
+            backend = vect.backend
+            zero = backend.convert(0)
+            buffer = [zero] * len(coordinates)
+        elif len(coordinates) != len(buffer):
+            raise ValueError(VECTORS_MUST_HAVE_SAME_DIMENSION_MSG)
+        with backend.local_context():
+            if c is None:
+                for i, v in enumerate(coordinates):
+                    buffer[i] += v
+            else:
+                c = backend.convert(c)
+                for i, v in enumerate(coordinates):
+                    buffer[i] += c * v
+        count += 1
+    if buffer is None:
+        raise ValueError(NO_VECTORS_TO_REDUCE_MSG)
+    if coefficients is not None and any(True for _ in coefficients):
+        raise ValueError(COEFFICIENTS_AND_VECTORS_LENGTH_MSG)
+    return buffer, backend, count
+
+
+def vector_sum(vectors) -> Vector:
+    """Sum any iterable of vectors into a single preallocated buffer."""
+    buffer, backend, _ = _accumulate(vectors)
+    return Vector(buffer, backend=backend)
+
+
+def centroid(vectors) -> Vector:
+    """Mean of any iterable of vectors."""
+    buffer, backend, count = _accumulate(vectors)
+    with backend.local_context():
+        mean = [v / count for v in buffer]
+    return Vector(mean, backend=backend)
+
+
+def linear_combination(coefficients, vectors) -> Vector:
+    """Compute ``sum(c * v for c, v in zip(coefficients, vectors))``."""
+    buffer, backend, _ = _accumulate(vectors, coefficients)
+    return Vector(buffer, backend=backend)
 
 
 def angle_between_vectors(
     vect1: Vector, vect2: Vector, sexagesimal: bool = None
 ) -> float:
-    try:
-        result = math.acos(
-            dot_product(vect1, vect2) / (len(vect1) * len(vect2))
-        )
-        if sexagesimal:
-            return (180 * result) / math.pi
-        return result
-    except Exception as e:
-        raise e
+    with vect1.backend.local_context():
+        magnitudes = abs(vect1) * abs(vect2)
+        # checked first, Decimal raises InvalidOperation for 0 / 0
+        if not magnitudes:
+            raise Exception(NO_ANGLE_WITH_ZERO_VECTOR_MSG)
+        cosine = dot_product(vect1, vect2) / magnitudes
+    # rounding can push the cosine slightly outside of [-1, 1]
+    result = math.acos(min(1.0, max(-1.0, float(cosine))))
+    if sexagesimal:
+        return (180 * result) / math.pi
+    return result
 
 
 def is_parallel(vect1: Vector, vect2: Vector, tolerance=None) -> bool:
@@ -152,12 +298,64 @@ def is_parallel(vect1: Vector, vect2: Vector, tolerance=None) -> bool:
         dot_product(vect2, vect2) < _tolerance
     ):
         return True
-    result = True
-    unit_v1 = vect1.unit_vector.coordinates
-    unit_v2 = vect2.unit_vector.coordinates
-    for v1, v2 in zip(unit_v1, unit_v2):
-        result = result and (abs(round(v1, 10)) == abs(round(v2, 10)))
-    return result
+    # u1 == u2 or u1 == -u2, compared as whole vectors
+    return parallel_direction_key(vect1) == parallel_direction_key(vect2)
+
+
+ParallelClass = namedtuple("ParallelClass", ["representative", "members"])
+
+
+def parallel_direction_key(vect: Vector, decimals=10, tolerance=None):
+    """Hashable canonical direction shared by all the vectors parallel
+    to ``vect``.
+
+    The unit vector is sign fixed so that its first nonzero coordinate
+    is positive and then rounded to ``decimals`` places. Near-zero
+    vectors have no direction and get the key ``None``.
+    """
+    _tolerance = 1e-10 if tolerance is None else tolerance
+    if dot_product(vect, vect) < _tolerance:
+        return None
+    key = [round(v, decimals) for v in vect.unit_vector.coordinates]
+    for v in key:
+        if v:
+            if v < 0:
+                key = [-x for x in key]
+            break
+    return tuple(key)
+
+
+def group_parallel(items, key=None, decimals=10, tolerance=None) -> list:
+    """Bucket vectors into parallel classes in a single pass.
+
+    Parameters
+    ----------
+    items : iterable
+        The vectors to group, or any objects from which ``key`` extracts
+        a vector (e.g. ``operator.attrgetter("normal_vector")`` groups
+        lines and planes by orientation).
+    key : callable, optional
+        Function returning the vector of each item.
+    decimals, tolerance :
+        Quantization and zero tolerance, see ``parallel_direction_key``.
+
+    Returns
+    -------
+    list of ParallelClass
+        One class per direction, in order of first appearance. The
+        representative is the first member of the class. Near-zero
+        vectors are grouped in a class of their own.
+    """
+    classes = {}
+    for item in items:
+        vect = item if key is None else key(item)
+        direction = parallel_direction_key(vect, decimals, tolerance)
+        parallel_class = classes.get(direction)
+        if parallel_class is None:
+            parallel_class = ParallelClass(item, [])
+            classes[direction] = parallel_class
+        parallel_class.members.append(item)
+    return list(classes.values())
 
 
 def is_orthogonal(vector1: Vector, vector2: Vector, tolerance=None) -> bool:
@@ -165,9 +363,17 @@ def is_orthogonal(vector1: Vector, vector2: Vector, tolerance=None) -> bool:
     return abs(dot_product(vector1, vector2)) < _tolerance
 
 
+def _is_normal_to(vector: Vector, normal: Vector) -> bool:
+    # relative test, |v . n| must be small compared to |v| |n| so that the
+    # check does not depend on the scale of the factors
+    dot = float(abs(dot_product(vector, normal)))
+    return dot <= DEFAULT_TOLERANCE * float(abs(vector)) * float(abs(normal))
+
+
 def get_parallel_projection(vect, basis):
     try:
-        u = dot_product(vect, basis) / dot_product(basis, basis)
+        with basis.backend.local_context():
+            u = dot_product(vect, basis) / dot_product(basis, basis)
         return times_scalar(basis, u)
     except Exception as e:
         if str(e) == CANNOT_NORMALIZE_ZERO_VECTOR_MSG:
@@ -187,29 +393,30 @@ def get_orthogonal_projection(vector: Vector, basis: Vector) -> Vector:
             raise e
 
 
-def cross_product(vect1: Vector, vect2: Vector) -> Vector:
-    try:
-        if vect1.dimension == 3 and vect2.dimension == 3:
-            x1, y1, z1 = vect1.coordinates
-            x2, y2, z2 = vect2.coordinates
+def cross_product(vect1: Vector, vect2: Vector, verify=False) -> Vector:
+    if vect1.dimension == 3 and vect2.dimension == 3:
+        x1, y1, z1 = vect1.coordinates
+        x2, y2, z2 = vect2.coordinates
+        with vect1.backend.local_context():
             x = (y1 * z2) - (y2 * z1)
             y = ((x1 * z2) - (x2 * z1)) * -1
             z = (x1 * y2) - (x2 * y1)
-            cross_product = Vector([x, y, z])
-            # Verifing that the answer is really ortogonal
-            if is_orthogonal(vect1, cross_product) and is_orthogonal(
-                vect1, cross_product
-            ):
-                return Vector([x, y, z])
+        cross_product = Vector([x, y, z], backend=vect1.backend)
+        # Verifing that the answer is really ortogonal (debug mode)
+        if verify and not (
+            _is_normal_to(vect1, cross_product)
+            and _is_normal_to(vect2, cross_product)
+        ):
             raise Exception(RESULT_WAS_NOT_ORTOGONAL_AFTER_OPERATION_MSG)
-        raise Exception(CROSS_PRODUCT_OPERATION_ONLY_FOR_3D_VECTORS_MSG)
-    except Exception as e:
-        raise e
+        return cross_product
+    raise Exception(CROSS_PRODUCT_OPERATION_ONLY_FOR_3D_VECTORS_MSG)
 
 
-def area_of_parallelogram_spanned(vect1: Vector, vect2: Vector) -> Vector:
-    return len(cross_product(vect1, vect2))
+def area_of_parallelogram_spanned(vect1: Vector, vect2: Vector) -> Decimal:
+    return abs(cross_product(vect1, vect2))
 
 
 def area_of_triangle_spanned(vect1: Vector, vect2: Vector) -> Decimal:
-    return len(cross_product(vect1, vect2)) / 2
+    area = area_of_parallelogram_spanned(vect1, vect2)
+    with vect1.backend.local_context():
+        return area / 2
@@ -31,6 +31,7 @@ PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__)))
 
 
 REQUIREMENTS = [
+    "numpy",
 ]
 
 with open(PATH / "pylabf" / "__init__.py") as fp:
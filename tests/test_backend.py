@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import pytest
+
+from pylabf import Backend, FloatBackend
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_backends_must_implement_convert_and_sqrt():
+    with pytest.raises(TypeError):
+        Backend()
+
+    class Incomplete(Backend):
+        def convert(self, value):
+            return value
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+    class Doubled(FloatBackend):
+        name = "doubled"
+
+        def convert(self, value):
+            return 2 * float(value)
+
+    assert Doubled().convert(1) == 2
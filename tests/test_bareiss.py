@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from fractions import Fraction
+
+import numpy as np
+
+import pytest
+
+from pylabf import BareissElimination, LinearSystem, Parametrization, Vector
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_determinant_of_integer_matrices(seed):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(-9, 10, size=(6, 6))
+    rows = np.c_[a, np.zeros(6, dtype=int)].tolist()
+    bareiss = BareissElimination(LinearSystem.from_rows(rows))
+    assert bareiss.determinant() == round(np.linalg.det(a))
+    assert bareiss.rank == np.linalg.matrix_rank(a)
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_determinant_of_rational_entries(backend):
+    rows = [["0", "0.5", "1"], ["0.25", "2", "3"]]
+    bareiss = BareissElimination(LinearSystem.from_rows(rows, backend))
+    # one row swap, so the sign changes
+    assert bareiss.determinant() == Fraction(-1, 8)
+
+
+def test_determinant_errors_and_singular_matrices():
+    singular = LinearSystem.from_rows([[1, 2, 3], [2, 4, 5]])
+    assert BareissElimination(singular).determinant() == 0
+    assert BareissElimination(singular).rank == 1
+    rectangular = LinearSystem.from_rows([[1, 2, 3, 4], [2, 4, 5, 6]])
+    with pytest.raises(
+        Exception,
+        match=BareissElimination.DETERMINANT_ONLY_FOR_SQUARE_SYSTEMS_MSG,
+    ):
+        BareissElimination(rectangular).determinant()
+
+
+def test_consistency():
+    consistent = LinearSystem.from_rows([[1, 1, 2], [2, 2, 4], [1, -1, 0]])
+    inconsistent = LinearSystem.from_rows([[1, 1, 2], [2, 2, 5]])
+    assert BareissElimination(consistent).is_consistent
+    assert not BareissElimination(inconsistent).is_consistent
+    with pytest.raises(Exception, match=LinearSystem.NO_SOLUTIONS_MSG):
+        BareissElimination(inconsistent).solve()
+
+
+def test_unique_solution_is_exact():
+    rows = [["0.1", "0.2", "0.3"], ["0.4", "0.5", "0.6"]]
+    solution = BareissElimination(LinearSystem.from_rows(rows)).solve()
+    assert solution == Vector([Fraction(-1), Fraction(2)], "fraction")
+
+
+def test_parametrized_solve():
+    rows = [[1, 1, 1, 3], [0, 1, -1, 1], [1, 2, 0, 4]]
+    bareiss = BareissElimination(LinearSystem.from_rows(rows))
+    assert bareiss.rank == 2
+    solution = bareiss.solve()
+    assert isinstance(solution, Parametrization)
+    expected = LinearSystem.from_rows(rows, "fraction").solve()
+    assert solution.basepoint == expected.basepoint
+    assert solution.direction_vectors == expected.direction_vectors
+    with pytest.raises(Exception, match=LinearSystem.INF_SOLUTIONS_MSG):
+        bareiss.solve(parametrize=False)
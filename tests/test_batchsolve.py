@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from pylabf import (
+    INF_SOLUTIONS,
+    LinearSystem,
+    Line,
+    NO_SOLUTIONS,
+    Parametrization,
+    UNIQUE_SOLUTION,
+    solve_small_systems,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def _status_of(rows):
+    try:
+        solution = LinearSystem.from_rows(rows, backend="fraction").solve()
+    except Exception:
+        return NO_SOLUTIONS
+    if isinstance(solution, Parametrization):
+        return INF_SOLUTIONS
+    return UNIQUE_SOLUTION
+
+
+def test_small_magnitude_systems_are_regular():
+    a = np.diag([1e-6, 1e-6])[np.newaxis]
+    b = np.array([[1e-6, 1e-6]])
+    solutions, status = solve_small_systems(a, b)
+    assert status.tolist() == [UNIQUE_SOLUTION]
+    np.testing.assert_allclose(solutions, [[1.0, 1.0]])
+    system = LinearSystem(
+        [Line([1e-6, 0], 1e-6, "float"), Line([0, 1e-6], 1e-6, "float")]
+    )
+    np.testing.assert_allclose(system.solve().coordinates, [1.0, 1.0])
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 4])
+@pytest.mark.parametrize("scale", [1e-8, 1.0, 1e8])
+def test_status_agrees_with_linear_system(k, scale):
+    rng = np.random.default_rng(k)
+    a = rng.integers(-2, 3, size=(200, k, k))
+    b = rng.integers(-2, 3, size=(200, k))
+    _, status = solve_small_systems(a * scale, b * scale)
+    expected = [_status_of(np.c_[ai, bi].tolist()) for ai, bi in zip(a, b)]
+    assert status.tolist() == expected
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from decimal import localcontext
+
+import pytest
+
+from pylabf import Hyperplane, Line, LinearSystem, Plane, use_backend
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "plane_type, coefficients",
+    [(Line, ["1", "2", "3"]), (Line, ["1"]), (Plane, ["1", "2", "3", "4"])],
+)
+def test_specializations_reject_other_dimensions(plane_type, coefficients):
+    with pytest.raises(
+        Exception, match=Hyperplane.NORMAL_VECTOR_DIMENSION_MSG
+    ):
+        plane_type(coefficients, "5")
+
+
+def test_specializations_default_dimension():
+    assert Line().dimension == 2
+    assert Plane().dimension == 3
+    assert Hyperplane(["1", "2", "3", "4"], "5").dimension == 4
+
+
+def test_linear_system_of_hyperplanes():
+    system = LinearSystem(
+        [
+            Hyperplane(["1", "1", "1", "1"], "4"),
+            Hyperplane(["0", "1", "0", "0"], "1"),
+            Hyperplane(["0", "0", "1", "0"], "1"),
+            Hyperplane(["0", "0", "0", "1"], "1"),
+        ]
+    )
+    assert system.solve().coordinates == (1, 1, 1, 1)
+
+
+def test_basepoint_does_not_depend_on_the_ambient_context():
+    with use_backend("decimal"):
+        expected = Plane(["3", "0", "0"], "1").basepoint
+    assert len(expected.coordinates[0].as_tuple().digits) == 30
+    assert Plane(["3", "0", "0"], "1").basepoint == expected
+    with localcontext() as context:
+        context.prec = 10
+        assert Plane(["3", "0", "0"], "1").basepoint == expected
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_str_is_the_same_on_every_backend(backend):
+    plane = Plane(["0.333", "2", "-1"], "0.143", backend)
+    assert str(plane) == "0.333x_1 + 2x_2 - x_3 = 0.143"
+    line = Line(["1", "-2"], "2", backend)
+    assert str(line) == "x_1 - 2x_2 = 2"
+    system = LinearSystem([plane, Plane(["0", "3", "-1"], "1", backend)])
+    assert "/" not in str(system.solve())
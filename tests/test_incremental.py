@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import pytest
+
+from pylabf import (
+    INCONSISTENT,
+    IncrementalLinearSystem,
+    NARROWED,
+    Plane,
+    REDUNDANT,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("method", ["solve", "to_linear_system"])
+def test_no_equations(method):
+    system = IncrementalLinearSystem()
+    with pytest.raises(
+        Exception, match=IncrementalLinearSystem.NO_EQUATIONS_MSG
+    ):
+        getattr(system, method)()
+
+
+def test_append_statuses():
+    system = IncrementalLinearSystem()
+    assert system.extend(
+        [
+            Plane(["1", "1", "1"], "3"),
+            Plane(["2", "2", "2"], "6"),
+            Plane(["0", "1", "0"], "1"),
+            Plane(["0", "0", "1"], "1"),
+            Plane(["1", "1", "1"], "4"),
+        ]
+    ) == [NARROWED, REDUNDANT, NARROWED, NARROWED, INCONSISTENT]
+    assert system.rank == 3
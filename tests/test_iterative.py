@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import re
+
+import numpy as np
+
+import pytest
+
+from pylabf import (
+    INITIAL_GUESS_DIMENSION_MSG,
+    MATRIX_MUST_BE_SYMMETRIC_MSG,
+    RELAXATION_FACTOR_MSG,
+    ZERO_ON_THE_DIAGONAL_MSG,
+    LinearSystem,
+    LUFactorization,
+    conjugate_gradient,
+    gauss_seidel,
+    jacobi,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+SOLVERS = [jacobi, gauss_seidel, conjugate_gradient]
+
+
+def _spd_system(n=20, seed=0):
+    """Diagonally dominant, symmetric positive-definite system."""
+    rng = np.random.default_rng(seed)
+    m = rng.uniform(-1, 1, size=(n, n))
+    a = (m + m.T) / 2
+    a += np.diag(np.abs(a).sum(axis=1) + 1)
+    x = rng.normal(size=n)
+    system = LinearSystem.from_rows(np.c_[a, a @ x].tolist(), "float")
+    return system, x
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_convergence(solver):
+    system, x = _spd_system()
+    result = solver(system, tolerance=1e-12)
+    assert result.converged
+    assert result.iterations == len(result.residuals)
+    np.testing.assert_allclose(result.solution.coordinates, x, atol=1e-9)
+    assert result.solution.backend.name == "float"
+
+
+def test_over_relaxation_converges():
+    system, x = _spd_system()
+    result = gauss_seidel(system, tolerance=1e-12, omega=1.2)
+    assert result.converged
+    np.testing.assert_allclose(result.solution.coordinates, x, atol=1e-9)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_warm_start_takes_fewer_iterations(solver):
+    system, x = _spd_system()
+    cold = solver(system, tolerance=1e-12)
+    x0 = x + 1e-6 * np.ones_like(x)
+    warm = solver(system, tolerance=1e-12, x0=x0.tolist())
+    assert warm.converged
+    assert warm.iterations < cold.iterations
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_max_iterations(solver):
+    system, _ = _spd_system()
+    result = solver(system, tolerance=1e-15, max_iterations=2)
+    assert not result.converged
+    assert result.iterations == 2
+
+
+@pytest.mark.parametrize("solver", [jacobi, gauss_seidel])
+def test_zero_on_the_diagonal(solver):
+    system = LinearSystem.from_rows([[0, 1, 1], [1, 0, 1]])
+    with pytest.raises(Exception, match=ZERO_ON_THE_DIAGONAL_MSG):
+        solver(system)
+
+
+def test_conjugate_gradient_needs_a_symmetric_matrix():
+    system = LinearSystem.from_rows([[4, 1, 1], [0, 3, 1]])
+    with pytest.raises(Exception, match=MATRIX_MUST_BE_SYMMETRIC_MSG):
+        conjugate_gradient(system)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_shape_errors(solver):
+    with pytest.raises(
+        Exception, match=LUFactorization.SYSTEM_MUST_BE_SQUARE_MSG
+    ):
+        solver(LinearSystem.from_rows([[4, 1, 1, 1], [1, 3, 1, 1]]))
+    system, _ = _spd_system(n=3)
+    with pytest.raises(ValueError, match=INITIAL_GUESS_DIMENSION_MSG):
+        solver(system, x0=[0, 0])
+
+
+@pytest.mark.parametrize("omega", [0, -0.5, 2, 2.5])
+def test_relaxation_factor_out_of_range(omega):
+    system, _ = _spd_system(n=3)
+    message = re.escape(RELAXATION_FACTOR_MSG.format(omega))
+    with pytest.raises(ValueError, match=message):
+        gauss_seidel(system, omega=omega)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from pylabf import (
+    ADD_MULTIPLE,
+    PARTIAL,
+    SCALED,
+    LinearSystem,
+    Parametrization,
+    Plane,
+    Vector,
+    times_scalar,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_large_float_system_with_first_nonzero_pivoting():
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=(120, 120))
+    x = rng.normal(size=120)
+    rows = np.c_[a, a @ x].tolist()
+    system = LinearSystem.from_rows(rows, backend="float")
+    np.testing.assert_allclose(system.solve().coordinates, x, atol=1e-8)
+
+
+def test_observer_sees_the_eliminated_entry_as_zero():
+    seen = []
+
+    def observer(event):
+        if getattr(event, "kind", None) == ADD_MULTIPLE:
+            target = event.rows[1]
+            seen.append(system[target].normal_vector.coordinates[0])
+
+    system = LinearSystem.from_rows(
+        [[0.3, 0.2, 0.3], [0.7, 0.1, 0.7], [0.9, 0.3, 0.1]],
+        backend="float",
+        observer=observer,
+    )
+    system.clear_coefficients_below(0, 0)
+    assert seen == [0, 0]
+
+
+def test_planes_is_read_only():
+    system = LinearSystem([Plane(["1", "1", "1"], "1")])
+    with pytest.raises(TypeError):
+        system.planes[0] = Plane(["0", "1", "0"], "2")
+    system[0] = Plane(["0", "1", "0"], "2")
+    assert system.planes == (Plane(["0", "1", "0"], "2"),)
+    system.planes = [Plane(["0", "0", "1"], "3")]
+    assert system[0] == Plane(["0", "0", "1"], "3")
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_compute_rref(backend):
+    system = LinearSystem(
+        [
+            Plane(["0", "1", "1"], "1", backend),
+            Plane(["1", "-1", "1"], "2", backend),
+            Plane(["1", "2", "-5"], "3", backend),
+        ]
+    )
+    rref = system.compute_rref()
+    coefficients, constants = rref.to_arrays()
+    np.testing.assert_allclose(coefficients, np.eye(3), atol=1e-12)
+    np.testing.assert_allclose(constants, np.array([23, 7, 2]) / 9)
+    assert rref is not system
+    assert system[0] == Plane(["0", "1", "1"], "1", backend)
+
+
+@pytest.mark.parametrize("pivoting", ["first_nonzero", PARTIAL, SCALED])
+def test_unique_solution(pivoting):
+    system = LinearSystem(
+        [
+            Plane(["1", "1", "1"], "6"),
+            Plane(["1", "-1", "0"], "-1"),
+            Plane(["0", "1", "-1"], "-1"),
+            Plane(["2", "2", "2"], "12"),
+        ]
+    )
+    assert system.solve(pivoting=pivoting) == Vector(["1", "2", "3"])
+
+
+def test_inconsistent_system():
+    system = LinearSystem(
+        [
+            Plane(["1", "1", "-1"], "2"),
+            Plane(["2", "3", "-1"], "0"),
+            Plane(["3", "4", "-2"], "1"),
+        ]
+    )
+    with pytest.raises(Exception, match=LinearSystem.NO_SOLUTIONS_MSG):
+        system.solve()
+    with pytest.raises(Exception, match=LinearSystem.NO_SOLUTIONS_MSG):
+        system.solve(parametrize=False)
+
+
+def test_infinite_solutions():
+    system = LinearSystem(
+        [Plane(["1", "1", "1"], "3"), Plane(["0", "1", "-1"], "1")],
+        backend="fraction",
+    )
+    solution = system.solve()
+    assert isinstance(solution, Parametrization)
+    assert solution.basepoint == Vector(["2", "1", "0"], "fraction")
+    assert solution.direction_vectors == [Vector(["-2", "1", "1"], "fraction")]
+    (direction,) = solution.direction_vectors
+    for t in (-1, 0, 3):
+        point = solution.basepoint + times_scalar(direction, t)
+        for plane in system:
+            assert plane.normal_vector * point == plane.constant_term
+    with pytest.raises(Exception, match=LinearSystem.INF_SOLUTIONS_MSG):
+        system.solve(parametrize=False)
+
+
+def _rows(system):
+    return [list(row) for row in system._rows]
+
+
+def _modify(system):
+    system.multiply_coefficient_and_row(2, 0)
+    system.add_multiple_times_row_to_row(-1, 0, 1)
+    system.swap_rows(1, 2)
+    system[2] = Plane(["7", "7", "7"], "7", "fraction")
+
+
+@pytest.mark.parametrize("modified", ["fork", "original"])
+def test_fork_is_copy_on_write(modified):
+    rows = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
+    original = LinearSystem.from_rows(rows, "fraction")
+    fork = original.fork()
+    untouched = fork if modified == "original" else original
+    changed = original if modified == "original" else fork
+    _modify(changed)
+    assert _rows(untouched) == rows
+    assert untouched[0] == Plane(["1", "2", "3"], "4", "fraction")
+    assert _rows(changed) != rows
+    # later writes on both sides stay isolated too
+    untouched.multiply_coefficient_and_row(3, 1)
+    assert _rows(untouched)[1] == [15, 18, 21, 24]
+    assert _rows(changed)[2] == [7, 7, 7, 7]
+
+
+def test_fork_of_a_fork():
+    rows = [[1, 2, 3], [4, 5, 6]]
+    original = LinearSystem.from_rows(rows, "fraction")
+    fork = original.fork()
+    nested = fork.fork()
+    nested.multiply_coefficient_and_row(2, 0)
+    fork.multiply_coefficient_and_row(3, 1)
+    assert _rows(original) == rows
+    assert _rows(fork) == [[1, 2, 3], [12, 15, 18]]
+    assert _rows(nested) == [[2, 4, 6], [4, 5, 6]]
+
+
+SQUARE_ROWS = [[2, 1, 7, 3], [5, -3, 1, 1], [4, 9, -2, 2]]
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_rank_determinant_and_nullspace(backend):
+    system = LinearSystem.from_rows(SQUARE_ROWS, backend)
+    assert system.rank() == 3
+    assert system.determinant() == pytest.approx(407)
+    assert system.nullspace() == []
+    singular = LinearSystem.from_rows(
+        [[1, 2, 3, 0], [2, 4, 6, 0], [1, 0, 1, 0]], backend
+    )
+    assert singular.rank() == 2
+    assert singular.determinant() == 0
+    (direction,) = singular.nullspace()
+    for plane in singular:
+        assert float(plane.normal_vector * direction) == pytest.approx(0)
+    assert direction.coordinates[2] == 1
+
+
+def test_determinant_of_a_non_square_system():
+    system = LinearSystem.from_rows(SQUARE_ROWS[:2])
+    assert system.rank() == 2
+    assert len(system.nullspace()) == 1
+    with pytest.raises(
+        Exception, match=LinearSystem.DETERMINANT_ONLY_FOR_SQUARE_SYSTEMS_MSG
+    ):
+        system.determinant()
+
+
+def test_echelon_form_is_cached_until_a_row_changes():
+    system = LinearSystem.from_rows(SQUARE_ROWS, "fraction")
+    echelon = system.echelon_form()
+    assert system.echelon_form() is echelon
+    assert system.determinant() == 407
+
+    system.swap_rows(0, 2)
+    assert system.echelon_form() is not echelon
+    assert system.determinant() == -407
+    system.swap_rows(0, 2)
+    assert system.determinant() == 407
+
+    system[2] = Plane(["7", "-2", "8"], "0", "fraction")
+    assert system.rank() == 2
+    assert system.determinant() == 0
+    assert len(system.nullspace()) == 1
+
+    system.multiply_coefficient_and_row(2, 0)
+    assert system.rank() == 2
+    system[2] = Plane(["0", "0", "1"], "0", "fraction")
+    assert system.rank() == 3
+    assert system.nullspace() == []
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+from pylabf import StreamingLeastSquares, least_squares
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_matches_numpy_lstsq():
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=(1000, 3))
+    b = a @ [1.0, 2.0, 3.0] + rng.normal(size=1000) * 0.1
+    x, residues, _, _ = np.linalg.lstsq(a, b, rcond=None)
+    rows = (list(ai) + [bi] for ai, bi in zip(a.tolist(), b.tolist()))
+    result = least_squares(rows, chunk_size=128, backend="float")
+    np.testing.assert_allclose(result.solution.coordinates, x)
+    assert np.isclose(result.residual_norm, np.sqrt(residues[0]))
+
+
+def test_append_and_extend_are_equivalent():
+    rows = [[1, 0, 1], [0, 1, 2], [1, 1, 4]]
+    accumulator = StreamingLeastSquares(chunk_size=2, backend="float")
+    accumulator.append(rows[0])
+    accumulator.extend(rows[1:])
+    result = accumulator.solve()
+    expected = least_squares(rows, backend="float")
+    np.testing.assert_allclose(
+        result.solution.coordinates, expected.solution.coordinates
+    )
+    assert len(accumulator) == 3
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from fractions import Fraction
+
+import pytest
+
+from pylabf import PARTIAL, SCALED, LinearSystem, LUFactorization, Plane
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+ROWS = [[2, 1, 7, 3], [5, -3, 1, 1], [4, 9, -2, 2]]
+SOLUTION = (Fraction(100, 407), Fraction(76, 407), Fraction(135, 407))
+
+
+@pytest.mark.parametrize("refine", [0, 1, 2])
+def test_refinement_keeps_fraction_solutions_exact(refine):
+    system = LinearSystem.from_rows(ROWS, backend="fraction")
+    assert system.solve(refine=refine).coordinates == SOLUTION
+    lu = system.lu_factorization()
+    constants = [row[-1] for row in ROWS]
+    assert lu.solve(constants, refine=refine).coordinates == SOLUTION
+
+
+def test_refinement_on_floats():
+    system = LinearSystem.from_rows(ROWS, backend="float")
+    solution = system.solve(refine=2).coordinates
+    for value, exact in zip(solution, SOLUTION):
+        assert value == pytest.approx(float(exact), abs=1e-15)
+
+
+def test_factorization_is_cached_until_a_row_changes():
+    system = LinearSystem.from_rows(ROWS, backend="fraction")
+    lu = system.lu_factorization()
+    assert system.lu_factorization() is lu
+    assert system.lu_factorization(SCALED) is not lu
+    system[0] = Plane(["1", "0", "0"], "1", "fraction")
+    assert system.lu_factorization() is not lu
+    solution = system.lu_factorization().solve([1, 1, 2])
+    assert solution.coordinates[0] == 1
+
+
+def test_solve_many():
+    system = LinearSystem.from_rows(ROWS, backend="fraction")
+    lu = system.lu_factorization()
+    constants = [[3, 1, 2], [1, 0, 0], [0, 0, 0]]
+    solutions = lu.solve_many(constants)
+    assert solutions[0].coordinates == SOLUTION
+    assert solutions == [lu.solve(b) for b in constants]
+    assert solutions[2].coordinates == (0, 0, 0)
+    with pytest.raises(
+        Exception, match=LUFactorization.CONSTANTS_MUST_MATCH_EQUATIONS_MSG
+    ):
+        lu.solve([1, 2])
+
+
+@pytest.mark.parametrize("pivoting", ["first_nonzero", PARTIAL, SCALED])
+def test_singular_matrix(pivoting):
+    rows = [[1, 2, 3, 1], [2, 4, 6, 2], [0, 1, 1, 0]]
+    system = LinearSystem.from_rows(rows, backend="fraction")
+    with pytest.raises(Exception, match=LUFactorization.SINGULAR_MATRIX_MSG):
+        system.lu_factorization(pivoting)
+
+
+def test_non_square_system():
+    system = LinearSystem.from_rows(ROWS[:2])
+    with pytest.raises(
+        Exception, match=LUFactorization.SYSTEM_MUST_BE_SQUARE_MSG
+    ):
+        system.lu_factorization()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from decimal import Decimal
+from fractions import Fraction
+
+from pylabf import LinearSystem, Plane, solve_many, use_backend
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_solve_many_matches_solve():
+    systems = [
+        LinearSystem.from_rows([[1, 1, k], [1, -1, 0]]) for k in range(10)
+    ]
+    systems.append([Plane(["1", "1", "1"], "1"), Plane(["1", "1", "1"], "2")])
+    results = list(
+        solve_many(systems, workers=2, backend="fraction", chunk_size=3)
+    )
+    assert [r.index for r in results] == list(range(11))
+    for k, result in enumerate(results[:-1]):
+        assert result.error is None
+        assert result.solution.coordinates == (Fraction(k, 2),) * 2
+    assert results[-1].solution is None
+    assert results[-1].error == LinearSystem.NO_SOLUTIONS_MSG
+    unordered = solve_many(systems, workers=2, ordered=False, chunk_size=3)
+    assert sorted([r.index for r in unordered]) == list(range(11))
+
+
+def test_solve_many_keeps_the_backend_of_each_system():
+    rows = [[1, 1, 1], [1, -1, 0]]
+    systems = [
+        LinearSystem.from_rows(rows, backend="float"),
+        LinearSystem.from_rows(rows, backend="decimal"),
+        LinearSystem.from_rows(rows, backend="fraction"),
+        [Plane(["1", "1", "1"], "3", backend="fraction")] * 2,
+    ]
+    with use_backend("decimal"):
+        results = list(solve_many(systems, workers=2, chunk_size=1))
+    solutions = [r.solution for r in results]
+    assert [s.backend.name for s in solutions[:3]] == [
+        "float",
+        "decimal",
+        "fraction",
+    ]
+    assert solutions[0].coordinates == (0.5, 0.5)
+    assert solutions[1].coordinates == (Decimal("0.5"),) * 2
+    assert solutions[2].coordinates == (Fraction(1, 2),) * 2
+    assert solutions[3].basepoint.backend.name == "fraction"
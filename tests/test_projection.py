@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from pylabf import (
+    NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG,
+    NO_UNIQUE_PARALLEL_COMPONENT_MSG,
+    VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+    OrthonormalBasisBuilder,
+    Projector,
+    Vector,
+    get_parallel_projection,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def _assert_orthonormal_basis_of(builder, vectors):
+    q = builder.basis.data
+    np.testing.assert_allclose(q @ q.T, np.eye(len(q)), atol=1e-12)
+    np.testing.assert_allclose((vectors @ q.T) @ q, vectors, atol=1e-9)
+
+
+@pytest.mark.parametrize("strategy", OrthonormalBasisBuilder.STRATEGIES)
+def test_rank_deficient_batch(strategy):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(500, 5)) @ rng.normal(size=(5, 40))
+    builder = OrthonormalBasisBuilder(strategy, chunk_size=128)
+    assert builder.extend(vectors) == 5
+    assert builder.rank == 5
+    _assert_orthonormal_basis_of(builder, vectors)
+
+
+@pytest.mark.parametrize("strategy", OrthonormalBasisBuilder.STRATEGIES)
+def test_interleaved_dependent_vectors(strategy):
+    e = np.eye(4)
+    vectors = np.array([e[0], 2 * e[0], e[1], e[0] + e[1], e[2], 3 * e[2]])
+    builder = OrthonormalBasisBuilder(strategy)
+    assert builder.extend(vectors) == 3
+    assert not builder.add(e[1] - e[2])
+    assert builder.add(e[3])
+    assert builder.rank == 4
+    _assert_orthonormal_basis_of(builder, np.vstack([vectors, e[3]]))
+
+
+def test_strategies_span_the_same_subspace():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(300, 7)) @ rng.normal(size=(7, 30))
+    bases = []
+    for strategy in OrthonormalBasisBuilder.STRATEGIES:
+        builder = OrthonormalBasisBuilder(strategy, chunk_size=64)
+        builder.extend(vectors)
+        bases.append(builder.basis.data)
+    mgs, householder = bases
+    np.testing.assert_allclose(
+        mgs.T @ mgs, householder.T @ householder, atol=1e-10
+    )
+
+
+def _stack(chunks):
+    return np.vstack([chunk.data for chunk in chunks])
+
+
+@pytest.mark.parametrize(
+    "basis", [Vector(["1", "2", "2"]), [[1, 0, 0], [0, 1, 1], [1, 1, 1]]]
+)
+def test_projector_components_add_up(basis):
+    rng = np.random.default_rng(3)
+    vectors = rng.standard_normal((50, 3))
+    projector = Projector(basis, chunk_size=7)
+    parallel, orthogonal = zip(*projector.components(vectors))
+    parallel, orthogonal = _stack(parallel), _stack(orthogonal)
+    np.testing.assert_allclose(parallel + orthogonal, vectors)
+    q = projector._orthonormal
+    np.testing.assert_allclose(orthogonal @ q.T, 0, atol=1e-12)
+
+
+def test_projector_agrees_with_get_parallel_projection():
+    basis = Vector(["1", "2", "2"], backend="float")
+    vectors = [Vector([i, 1 - i, 2 * i], backend="float") for i in range(10)]
+    projector = Projector(basis)
+    parallel = _stack(projector.parallel_components(vectors))
+    expected = [get_parallel_projection(v, basis).coordinates for v in vectors]
+    np.testing.assert_allclose(parallel, expected)
+
+
+def test_projector_consumes_generators_in_chunks():
+    projector = Projector([[1, 0], [1, 1]], chunk_size=3)
+    vectors = ([i, -i] for i in range(10))
+    chunks = list(projector.orthogonal_components(vectors))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    np.testing.assert_allclose(_stack(chunks), 0, atol=1e-12)
+    assert projector.rank == 2
+
+
+@pytest.mark.parametrize(
+    "method, message",
+    [
+        ("parallel_components", NO_UNIQUE_PARALLEL_COMPONENT_MSG),
+        ("orthogonal_components", NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG),
+        ("components", NO_UNIQUE_PARALLEL_COMPONENT_MSG),
+    ],
+)
+def test_projector_zero_basis(method, message):
+    projector = Projector([[0, 0, 0], [0, 0, 0]])
+    assert projector.rank == 0
+    with pytest.raises(Exception, match=message):
+        getattr(projector, method)([[1, 2, 3]])
+
+
+def test_projector_dimension_mismatch():
+    projector = Projector(Vector(["1", "0", "0"]))
+    with pytest.raises(ValueError, match=VECTORS_MUST_HAVE_SAME_DIMENSION_MSG):
+        list(projector.parallel_components([[1, 2]]))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from fractions import Fraction
+
+import pytest
+
+from pylabf import (
+    LinearSystem,
+    NATURAL,
+    Parametrization,
+    SparseLinearSystem,
+    get_backend,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+@pytest.mark.parametrize("ordering", ["minimum_degree", NATURAL])
+def test_solve_on_every_backend(backend, ordering):
+    system = SparseLinearSystem(
+        [{0: 1, 1: 2}, {0: 3, 1: 4}], [5, 6], 2, backend=backend
+    )
+    solution = system.solve(ordering=ordering)
+    assert solution.backend is get_backend(backend)
+    expected = [Fraction(-4), Fraction(9, 2)]
+    for value, exact in zip(solution.coordinates, expected):
+        assert abs(Fraction(value) - exact) < 1e-10
+
+
+def test_solve_matches_dense_parametrization():
+    rows = [[1, 2, 0, 3], [2, 4, 0, 6], [0, 0, 1, 1]]
+    dense = LinearSystem.from_rows(rows, backend="fraction")
+    sparse = SparseLinearSystem.from_linear_system(dense)
+    result = sparse.solve()
+    assert isinstance(result, Parametrization)
+    assert len(result.direction_vectors) == 1
+    x = result.basepoint.coordinates
+    d = result.direction_vectors[0].coordinates
+    for row in rows:
+        assert sum([a * v for a, v in zip(row, x)]) == row[-1]
+        assert sum([a * v for a, v in zip(row, d)]) == 0
+
+
+def test_inconsistent_system():
+    system = SparseLinearSystem(
+        [{0: 1, 1: 1}, {0: 2, 1: 2}], [1, 3], 2, backend="fraction"
+    )
+    with pytest.raises(Exception, match=LinearSystem.NO_SOLUTIONS_MSG):
+        system.solve()
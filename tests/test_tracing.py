@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from fractions import Fraction
+
+from pylabf import (
+    ADD_MULTIPLE,
+    SCALE,
+    SWAP,
+    EliminationStats,
+    LinearSystem,
+    Phase,
+    RowOperation,
+    trace_phase,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def _traced_solve(rows):
+    events = []
+    stats = EliminationStats()
+
+    def observer(event):
+        events.append(event)
+        stats(event)
+
+    system = LinearSystem.from_rows(
+        rows, backend="fraction", observer=observer
+    )
+    solution = system.solve()
+    return solution, events, stats
+
+
+def test_events_of_a_small_elimination():
+    solution, events, _ = _traced_solve([[0, 1, 1], [2, 2, 4]])
+    assert solution.coordinates == (1, 1)
+    operations = [e for e in events if isinstance(e, RowOperation)]
+    assert operations == [
+        RowOperation(SWAP, (0, 1), None),
+        RowOperation(ADD_MULTIPLE, (1, 0), Fraction(-2)),
+        RowOperation(SCALE, (0,), Fraction(1, 2)),
+    ]
+    phases = [e for e in events if isinstance(e, Phase)]
+    assert [p.name for p in phases] == ["triangular_form", "rref", "solve"]
+    assert all(p.elapsed >= 0 for p in phases)
+
+
+def test_elimination_stats():
+    _, _, stats = _traced_solve([[0, 1, 1], [2, 2, 4]])
+    assert stats.operations == {SWAP: 1, ADD_MULTIPLE: 1, SCALE: 1}
+    assert stats.total_operations == 3
+    assert stats.phase_calls == {"triangular_form": 1, "rref": 1, "solve": 1}
+    assert set(stats.phase_times) == {"triangular_form", "rref", "solve"}
+    stats.reset()
+    assert stats.total_operations == 0
+    assert not stats.phase_times and not stats.phase_calls
+
+
+def test_observer_of_an_existing_system():
+    system = LinearSystem.from_rows([[1, 1, 2], [1, -1, 0]])
+    stats = system.observer = EliminationStats()
+    system.swap_rows(0, 1)
+    system.multiply_coefficient_and_row(2, 0)
+    system.add_multiple_times_row_to_row(-1, 1, 0)
+    assert stats.operations == {SWAP: 1, SCALE: 1, ADD_MULTIPLE: 1}
+    assert not stats.phase_calls
+
+
+def test_trace_phase():
+    events = []
+    with trace_phase(events.append, "work"):
+        pass
+    assert [e.name for e in events] == ["work"]
+    with trace_phase(None, "work"):
+        pass
+    assert len(events) == 1
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import math
+
+import numpy as np
+
+import pytest
+
+from pylabf import (
+    COLLECTIONS_MUST_HAVE_SAME_LENGTH_MSG,
+    VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+    VECTOR_ARRAY_MUST_BE_TWO_DIMENSIONAL_MSG,
+    Vector,
+    VectorArray,
+    area_of_parallelogram_spanned,
+    angle_between_vectors,
+    area_of_triangle_spanned,
+    batch_angle_between_vectors,
+    batch_area_of_parallelogram_spanned,
+    batch_area_of_triangle_spanned,
+    batch_cross_product,
+    batch_dot_product,
+    batch_minus,
+    batch_plus,
+    batch_times_scalar,
+    cross_product,
+    iter_angles_between_vectors,
+    iter_batches,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "vectors",
+    [
+        [Vector(["1", "2"]), Vector(["3", "4"]), Vector(["5", "6"])],
+        [[1, 2], (3, 4), Vector([5, 6])],
+        ([i, i + 1] for i in (1, 3, 5)),
+        np.array([[1, 2], [3, 4], [5, 6]]),
+    ],
+)
+def test_construction(vectors):
+    array = VectorArray(vectors)
+    assert array.shape == (3, 2)
+    assert array.dimension == 2
+    assert len(array) == 3
+    assert array.data.dtype == np.float64
+    assert array == [[1, 2], [3, 4], [5, 6]]
+    assert VectorArray(array) == array
+
+
+@pytest.mark.parametrize(
+    "vectors", [np.arange(3), [[]], [], np.zeros((2, 2, 2))]
+)
+def test_construction_errors(vectors):
+    with pytest.raises(
+        ValueError, match=VECTOR_ARRAY_MUST_BE_TWO_DIMENSIONAL_MSG
+    ):
+        VectorArray(vectors)
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_round_trip(backend):
+    vectors = [Vector(["0.5", "-2"], backend), Vector(["3", "0.25"], backend)]
+    array = VectorArray(vectors)
+    assert array.to_vectors(backend) == vectors
+    assert all(v.backend.name == backend for v in array.to_vectors(backend))
+    assert list(array) == array.to_vectors()
+    assert array[1] == vectors[1]
+    assert array[:1] == VectorArray(vectors[:1])
+
+
+def test_iter_batches_are_lazy():
+    consumed = []
+
+    def vectors():
+        for i in range(5):
+            consumed.append(i)
+            yield [i, i]
+
+    batches = iter_batches(vectors(), chunk_size=2)
+    assert next(batches).tolist() == [[0, 0], [1, 1]]
+    assert consumed == [0, 1]
+    assert [len(b) for b in batches] == [2, 1]
+
+
+def test_broadcasting():
+    array = VectorArray([[1, 2], [3, 4]])
+    assert batch_plus(array, Vector(["1", "1"])) == [[2, 3], [4, 5]]
+    assert batch_minus(array, [[1, 2], [1, 2]]) == [[0, 0], [2, 2]]
+    assert array + [10, 20] == [[11, 22], [13, 24]]
+    assert array - array == [[0, 0], [0, 0]]
+    assert batch_times_scalar(array, 2) == [[2, 4], [6, 8]]
+    assert batch_times_scalar(array, [1, -1]) == [[1, 2], [-3, -4]]
+    assert batch_dot_product(array, Vector(["1", "1"])).tolist() == [3, 7]
+    assert batch_dot_product(array, array).tolist() == [5, 25]
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [batch_plus, batch_minus, batch_dot_product, batch_cross_product],
+)
+def test_dimension_mismatch(operation):
+    with pytest.raises(ValueError, match=VECTORS_MUST_HAVE_SAME_DIMENSION_MSG):
+        operation([[1, 2, 3], [4, 5, 6]], [[1, 2], [3, 4]])
+
+
+@pytest.mark.parametrize("scale", [1e-8, 1.0, 1e8])
+def test_batch_cross_product_verify_is_relative(scale):
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((1000, 3)) * scale
+    b = rng.standard_normal((1000, 3)) * scale
+    normals = batch_cross_product(a, b, verify=True)
+    assert np.allclose(normals.data, np.cross(a, b))
+
+
+def test_batch_cross_product_of_the_canonical_basis():
+    normals = batch_cross_product(
+        [[1, 0, 0], [0, 1, 0], [1, 2, 3]], [[0, 1, 0], [0, 0, 1], [2, 4, 6]]
+    )
+    assert normals == VectorArray([[0, 0, 1], [1, 0, 0], [0, 0, 0]])
+
+
+def test_batch_areas():
+    a = [[1, 0, 0], [2, 0, 0], [1, 1, 0]]
+    b = [[0, 1, 0], [0, 3, 0], [2, 2, 0]]
+    parallelograms = batch_area_of_parallelogram_spanned(a, b)
+    triangles = batch_area_of_triangle_spanned(a, b)
+    assert np.allclose(parallelograms, [1, 6, 0])
+    assert np.allclose(triangles, [0.5, 3, 0])
+
+
+@pytest.mark.parametrize("scale", [1e-8, 1.0, 1e8])
+def test_cross_product_verify_is_relative(scale):
+    rng = np.random.default_rng(1)
+    for a, b in (rng.standard_normal((2, 3)) * scale for _ in range(100)):
+        v = Vector(a.tolist(), backend="float")
+        w = Vector(b.tolist(), backend="float")
+        normal = cross_product(v, w, verify=True)
+        assert np.allclose(normal.coordinates, np.cross(a, b))
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_areas(backend):
+    v = Vector(["3", "0", "0"], backend=backend)
+    w = Vector(["1", "4", "0"], backend=backend)
+    assert area_of_parallelogram_spanned(v, w) == 12
+    assert area_of_triangle_spanned(v, w) == 6
+    assert area_of_parallelogram_spanned(v, v) == 0
+
+
+ANGLE_PAIRS = [
+    ([1, 0], [0, 1], math.pi / 2),
+    ([1, 0], [1, 1], math.pi / 4),
+    ([1, 1], [-2, -2], math.pi),
+    ([3, 3], [1, 1], 0.0),
+]
+
+
+@pytest.mark.parametrize("sexagesimal", [False, True])
+def test_batch_angles(sexagesimal):
+    a, b, expected = map(list, zip(*ANGLE_PAIRS))
+    if sexagesimal:
+        expected = np.degrees(expected)
+    angles = batch_angle_between_vectors(a, b, sexagesimal, chunk_size=3)
+    np.testing.assert_allclose(angles, expected, atol=1e-12)
+    scalar = [
+        angle_between_vectors(Vector(v), Vector(w), sexagesimal)
+        for v, w in zip(a, b)
+    ]
+    np.testing.assert_allclose(angles, scalar, atol=1e-12)
+
+
+def test_batch_angles_are_clamped():
+    # the cosines of these pairs round to slightly more than 1
+    a = np.array([[0.1, 0.2, 0.9]])
+    b = a * 0.1
+    assert batch_dot_product(a, b) > np.linalg.norm(a) * np.linalg.norm(b)
+    assert batch_angle_between_vectors(a, b).tolist() == [0.0]
+
+
+def test_batch_angles_of_zero_vectors_are_nan():
+    angles = batch_angle_between_vectors([[0, 0], [1, 0]], [[1, 1], [0, 1]])
+    assert np.isnan(angles[0])
+    assert np.isclose(angles[1], math.pi / 2)
+
+
+def test_batch_angles_against_a_reference_vector():
+    vectors = ([math.cos(t), math.sin(t)] for t in (0.1, 0.2, 0.3, 0.4))
+    chunks = list(
+        iter_angles_between_vectors(vectors, Vector(["1", "0"]), chunk_size=3)
+    )
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    np.testing.assert_allclose(np.concatenate(chunks), [0.1, 0.2, 0.3, 0.4])
+
+
+@pytest.mark.parametrize(
+    "vectors2, error, message",
+    [
+        ([[1, 0]], ValueError, COLLECTIONS_MUST_HAVE_SAME_LENGTH_MSG),
+        ([[1, 0]] * 3, ValueError, COLLECTIONS_MUST_HAVE_SAME_LENGTH_MSG),
+        ([[1, 0, 0]] * 2, ValueError, VECTORS_MUST_HAVE_SAME_DIMENSION_MSG),
+        (
+            Vector(["1", "0", "0"]),
+            ValueError,
+            VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+        ),
+    ],
+)
+def test_batch_angle_errors(vectors2, error, message):
+    with pytest.raises(error, match=message):
+        batch_angle_between_vectors([[1, 0], [0, 1]], vectors2)
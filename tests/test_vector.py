@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#     PyLABF Project (https://github.com/juniors90/PyLABF/).
+# Copyright (c) 2022, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/PyLABF/blob/master/LICENSE
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import copy
+import math
+import itertools
+import pickle
+from decimal import localcontext
+
+import pytest
+
+from pylabf import (
+    COEFFICIENTS_AND_VECTORS_LENGTH_MSG,
+    NO_ANGLE_WITH_ZERO_VECTOR_MSG,
+    NO_VECTORS_TO_REDUCE_MSG,
+    VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+    VECTOR_IS_IMMUTABLE_MSG,
+    Vector,
+    angle_between_vectors,
+    centroid,
+    group_parallel,
+    is_parallel,
+    linear_combination,
+    parallel_matrix,
+    parallel_pairs,
+    times_scalar,
+    vector_sum,
+)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+VECTORS = [[1, 1], [1, -1], [-2, -2], [3, -3], [0, 1], [0, -5], [2, 1]]
+
+
+def test_opposite_signs_per_coordinate_are_not_parallel():
+    assert not is_parallel(Vector([1, 1]), Vector([1, -1]))
+    assert is_parallel(Vector([1, 1]), Vector([-2, -2]))
+    assert is_parallel(Vector([1, -2, 3]), Vector([-1, 2, -3]))
+
+
+def test_parallel_apis_agree():
+    vectors = [Vector(v) for v in VECTORS]
+    matrix = parallel_matrix(VECTORS)
+    classes = group_parallel(vectors)
+    label = {}
+    for n, parallel_class in enumerate(classes):
+        for member in parallel_class.members:
+            label[member] = n
+    expected_pairs = []
+    for i, j in itertools.combinations(range(len(vectors)), 2):
+        parallel = is_parallel(vectors[i], vectors[j])
+        assert matrix[i, j] == parallel
+        assert (label[vectors[i]] == label[vectors[j]]) == parallel
+        if parallel:
+            expected_pairs.append((i, j))
+    assert parallel_pairs(VECTORS) == expected_pairs
+
+
+@pytest.mark.parametrize(
+    "coordinates, backend, error, message",
+    [
+        ([1, 2], "foo", ValueError, "Unknown numeric backend: foo"),
+        (["abc"], "float", ValueError, "could not convert"),
+        ([], None, ValueError, "The coordinates must be nonempty"),
+        (5, None, TypeError, "The coordinates must be an iterable"),
+    ],
+)
+def test_construction_errors(coordinates, backend, error, message):
+    with pytest.raises(error, match=message):
+        Vector(coordinates, backend=backend)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda: Vector(["3", "4"]).unit_vector,
+        lambda: times_scalar(Vector(["1", "2"]), "0.3333333333333333333"),
+        lambda: Vector(["1", "2"]) * Vector(["0.1111111111", "3"]),
+        lambda: centroid(
+            [Vector(["1", "1"]), Vector(["1", "2"]), Vector(["0", "0"])]
+        ),
+        lambda: Vector(["2", "3"]).magnitude,
+    ],
+)
+def test_decimal_results_do_not_depend_on_the_ambient_context(operation):
+    expected = operation()
+    with localcontext() as context:
+        context.prec = 5
+        assert operation() == expected
+
+
+def test_vectors_are_immutable():
+    v = Vector(["1", "2"])
+    with pytest.raises(AttributeError, match=VECTOR_IS_IMMUTABLE_MSG):
+        v.coordinates = (3, 4)
+    with pytest.raises(AttributeError, match=VECTOR_IS_IMMUTABLE_MSG):
+        v.extra = 1
+    with pytest.raises(AttributeError, match=VECTOR_IS_IMMUTABLE_MSG):
+        del v.dimension
+    assert v.coordinates == (1, 2)
+
+
+def test_magnitude_and_unit_vector_are_cached():
+    v = Vector(["3", "4"])
+    assert v.magnitude == 5
+    assert v.magnitude is v.magnitude
+    assert v.unit_vector == Vector(["0.6", "0.8"])
+    assert v.unit_vector is v.unit_vector
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_hash_and_eq_are_consistent(backend):
+    v = Vector(["1", "0.5"], backend)
+    w = Vector(["1.0", "0.50"], backend)
+    assert v == w and hash(v) == hash(w)
+    assert v != Vector(["1", "0.25"], backend)
+    assert len({v, w, Vector(["1", "0.25"], backend)}) == 2
+    assert v != (1, 0.5)
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_pickle_and_copy(backend):
+    v = Vector(["1", "0.5"], backend)
+    v.magnitude
+    restored = pickle.loads(pickle.dumps(v))
+    assert restored == v and hash(restored) == hash(v)
+    assert restored.backend is v.backend
+    assert restored.magnitude == v.magnitude
+    assert copy.copy(v) is v
+    assert copy.deepcopy([v])[0] is v
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_angle_between_vectors(backend):
+    v = Vector(["1", "0"], backend)
+    w = Vector(["1", "1"], backend)
+    assert math.isclose(angle_between_vectors(v, w), math.pi / 4)
+    assert math.isclose(angle_between_vectors(v, w, True), 45)
+    assert math.isclose(
+        angle_between_vectors(v, times_scalar(v, -3), True), 180
+    )
+
+
+def test_angle_between_vectors_is_clamped():
+    # the cosine rounds to slightly more than 1
+    v = Vector([0.1, 0.2, 0.9], backend="float")
+    assert angle_between_vectors(v, times_scalar(v, 0.1)) == 0.0
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_angle_with_the_zero_vector(backend):
+    v = Vector(["1", "2"], backend)
+    zero = Vector(["0", "0"], backend)
+    with pytest.raises(Exception, match=NO_ANGLE_WITH_ZERO_VECTOR_MSG):
+        angle_between_vectors(v, zero)
+    with pytest.raises(Exception, match=NO_ANGLE_WITH_ZERO_VECTOR_MSG):
+        angle_between_vectors(zero, v)
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_reductions_of_generators(backend):
+    def vectors():
+        for k in range(4):
+            yield Vector([k, 1, -k], backend)
+
+    total = vector_sum(vectors())
+    assert total == Vector(["6", "4", "-6"], backend)
+    assert total.backend.name == backend
+    assert centroid(vectors()) == Vector(["1.5", "1", "-1.5"], backend)
+    combination = linear_combination((c for c in "1032"), vectors())
+    assert combination == Vector(["12", "6", "-12"], backend)
+
+
+@pytest.mark.parametrize(
+    "reduction, arguments, message",
+    [
+        (vector_sum, ([],), NO_VECTORS_TO_REDUCE_MSG),
+        (centroid, (iter([]),), NO_VECTORS_TO_REDUCE_MSG),
+        (linear_combination, ([], []), NO_VECTORS_TO_REDUCE_MSG),
+        (
+            linear_combination,
+            ([1], [Vector([1, 2]), Vector([3, 4])]),
+            COEFFICIENTS_AND_VECTORS_LENGTH_MSG,
+        ),
+        (
+            linear_combination,
+            ([1, 2, 3], [Vector([1, 2]), Vector([3, 4])]),
+            COEFFICIENTS_AND_VECTORS_LENGTH_MSG,
+        ),
+        (
+            vector_sum,
+            ([Vector([1, 2]), Vector([1, 2, 3])],),
+            VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+        ),
+        (
+            centroid,
+            ([Vector([1, 2]), Vector([1])],),
+            VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+        ),
+        (
+            linear_combination,
+            ([1, 1], [Vector([1, 2]), Vector([1, 2, 3])]),
+            VECTORS_MUST_HAVE_SAME_DIMENSION_MSG,
+        ),
+    ],
+)
+def test_reduction_errors(reduction, arguments, message):
+    with pytest.raises(ValueError, match=message):
+        reduction(*arguments)